@@ -1,15 +1,20 @@
 # auto_worker_generation.py
 
+from collections import deque
+
 class AutoWorkerGenerator:
     def __init__(self):
-        self.clone_pool = [f"P-{i:03d}" for i in range(1, 11)]
+        self.clone_pool = deque(f"P-{i:03d}" for i in range(1, 11))
+        self._in_pool = set(self.clone_pool)
+        self._clone_ids = frozenset(self.clone_pool)
 
     def generate_worker(self, identity, vault_bundle, job_ticket):
         """Generate a new worker clone with specified parameters"""
         if not self.clone_pool:
             raise ValueError("No available clones in pool")
 
-        clone_id = self.clone_pool.pop(0)
+        clone_id = self.clone_pool.popleft()
+        self._in_pool.discard(clone_id)
         worker = {
             "id": clone_id,
             "identity": identity,
@@ -21,5 +26,8 @@ class AutoWorkerGenerator:
 
     def destroy_worker(self, worker_id):
         """Return worker to pool"""
-        if worker_id not in self.clone_pool:
-            self.clone_pool.append(worker_id)
\ No newline at end of file
+        if worker_id not in self._clone_ids:
+            raise ValueError(f"Unknown clone id: {worker_id}")
+        if worker_id not in self._in_pool:
+            self.clone_pool.append(worker_id)
+            self._in_pool.add(worker_id)
\ No newline at end of file
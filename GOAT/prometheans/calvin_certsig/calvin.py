@@ -1,13 +1,16 @@
 # calvin.py
 
 class CalvinPromethean:
-    def create_metadata(self, nft_type, payload):
+    _SERIAL_PREFIX = "CS-"
+    # placeholder
+    _SERIAL_CONST = _SERIAL_PREFIX + "000001"
+
+    def create_metadata(self, nft_type, payload, serial=None):
         return {
             "type": nft_type,
             "payload": payload,
-            "serial": self.generate_serial()
+            "serial": serial if serial is not None else self.generate_serial()
         }
 
     def generate_serial(self):
-        # placeholder
-        return "CS-" + "000001"
\ No newline at end of file
+        return self._SERIAL_CONST
\ No newline at end of file
@@ -9,20 +9,60 @@ including reinforcement learning, knowledge distillation, and continuous improve
 
 import asyncio
 import numpy as np
-import pandas as pd
-from typing import Dict, Any, List, Optional, Tuple, Callable, Set
+from typing import Dict, Any, List, Optional, Tuple, Callable, Set, FrozenSet
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict, deque
-import random
+from collections import deque
 import math
+import itertools
+import time
 import json
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error
-import warnings
-warnings.filterwarnings('ignore')
+
+# Numba JIT for the similarity / feature hot loops (optional import)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Fast JSON serialization for knowledge export (optional import)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _mode_and_freq(codes):
+    """Most frequent integer code and its relative frequency"""
+    counts = np.bincount(codes)
+    top = counts.argmax()
+    return top, counts[top] / codes.size
+
+
+if NUMBA_AVAILABLE:
+    _mode_and_freq = njit(cache=True)(_mode_and_freq)
+
+    @njit(cache=True)
+    def _jaccard_batch(matrix, query, row_sizes, query_size):
+        """Jaccard similarity of each key-membership row against a query row"""
+        similarity = np.zeros(matrix.shape[0], dtype=np.float64)
+        for row in range(matrix.shape[0]):
+            intersection = 0
+            for column in range(matrix.shape[1]):
+                if matrix[row, column] and query[column]:
+                    intersection += 1
+            union = row_sizes[row] + query_size - intersection
+            if union > 0:
+                similarity[row] = intersection / union
+        return similarity
+else:
+    def _jaccard_batch(matrix, query, row_sizes, query_size):
+        """Jaccard similarity of each key-membership row against a query row"""
+        intersection = matrix[:, query].sum(axis=1)
+        union = row_sizes + query_size - intersection
+        return intersection / np.maximum(union, 1)
 
 
 class LearningStrategy(Enum):
@@ -42,7 +82,7 @@ class LearningPhase(Enum):
     TRANSFER = "transfer"
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningExperience:
     """
     A learning experience or training example.
@@ -54,12 +94,8 @@ class LearningExperience:
     timestamp: datetime
     context: Optional[Dict[str, Any]] = None
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
-
 
-@dataclass
+@dataclass(slots=True)
 class LearnedKnowledge:
     """
     Knowledge learned from experiences.
@@ -68,12 +104,8 @@ class LearnedKnowledge:
     confidence: float
     evidence_count: int
     last_updated: datetime
-    related_concepts: Set[str]
-    performance_metrics: Dict[str, float]
-
-    def __post_init__(self):
-        if self.last_updated is None:
-            self.last_updated = datetime.now()
+    related_concepts: Set[str] = field(default_factory=set)
+    performance_metrics: Dict[str, float] = field(default_factory=dict)
 
 
 class AdaptiveLearning:
@@ -95,9 +127,9 @@ class AdaptiveLearning:
         self.reflection_manager = reflection_manager
         self.predictive_engine = predictive_engine
 
-        # Learning experiences
-        self.experiences: List[LearningExperience] = []
+        # Learning experiences (struct-of-arrays ring buffer)
         self.max_experiences = 10000
+        self._init_experience_buffer()
 
         # Learned knowledge base
         self.knowledge_base: Dict[str, LearnedKnowledge] = {}
@@ -128,8 +160,71 @@ class AdaptiveLearning:
         # Knowledge distillation
         self.distillation_queue: List[Dict[str, Any]] = []
 
+        # Batched random draws for epsilon-greedy action selection
+        self.random_pool_size = 4096
+        self._rng = np.random.default_rng()
+        self._uniform_pool = self._rng.random(self.random_pool_size)
+        self._uniform_index = 0
+
         print("🧠 Adaptive Learning initialized")
 
+    def _init_experience_buffer(self):
+        """Allocate the struct-of-arrays experience ring buffer"""
+        size = self.max_experiences
+
+        self._rewards = np.zeros(size, dtype=np.float64)
+        self._actions = np.zeros(size, dtype=np.int32)
+        self._timestamps_ns = np.zeros(size, dtype=np.int64)
+        self._states = np.empty(size, dtype=object)
+        self._next_states = np.empty(size, dtype=object)
+        self._contexts = np.empty(size, dtype=object)
+
+        # Key-membership matrix (one row per slot, one column per state key)
+        self._key_matrix = np.zeros((size, 16), dtype=bool)
+        self._key_counts = np.zeros(size, dtype=np.int32)
+
+        self._head = 0
+        self._count = 0
+
+        # Integer codes for actions and state keys
+        self._action_vocab: Dict[str, int] = {}
+        self._action_names: List[str] = []
+        self._key_vocab: Dict[str, int] = {}
+
+        # Key-membership columns memoized per distinct state key set
+        self._key_set_columns: Dict[FrozenSet[str], np.ndarray] = {}
+
+        # Running per-action aggregates over the retained experiences
+        self._action_reward_sum: Dict[str, float] = {}
+        self._action_count: Dict[str, int] = {}
+        self._action_success: Dict[str, int] = {}
+
+    @property
+    def experiences(self) -> List[LearningExperience]:
+        """Stored experiences, oldest first"""
+        return [
+            LearningExperience(
+                state=self._states[slot],
+                action=self._action_names[self._actions[slot]],
+                reward=float(self._rewards[slot]),
+                next_state=self._next_states[slot],
+                timestamp=datetime.fromtimestamp(self._timestamps_ns[slot] / 1e9),
+                context=self._contexts[slot]
+            )
+            for slot in self._recent_slots(self._count)
+        ]
+
+    def _update_action_aggregates(self, action: str, reward: float, sign: int):
+        """Add (sign=1) or remove (sign=-1) an experience from the per-action aggregates"""
+        self._action_reward_sum[action] = self._action_reward_sum.get(action, 0.0) + sign * reward
+        self._action_count[action] = self._action_count.get(action, 0) + sign
+        if reward > 0:
+            self._action_success[action] = self._action_success.get(action, 0) + sign
+
+    def _recent_slots(self, n: int) -> np.ndarray:
+        """Get ring buffer slots of the n most recent experiences, oldest first"""
+        return (self._head - n + np.arange(n)) % self.max_experiences
+
     def add_experience(self, state: Dict[str, Any], action: str, reward: float,
                       next_state: Dict[str, Any], context: Optional[Dict[str, Any]] = None):
         """
@@ -142,20 +237,29 @@ class AdaptiveLearning:
             next_state: Next state
             context: Additional context
         """
-        experience = LearningExperience(
-            state=state,
-            action=action,
-            reward=reward,
-            next_state=next_state,
-            timestamp=datetime.now(),
-            context=context
-        )
+        action_code = self._action_vocab.get(action)
+        if action_code is None:
+            action_code = self._action_vocab[action] = len(self._action_names)
+            self._action_names.append(action)
+
+        # Write into the ring buffer, overwriting the oldest slot when full
+        slot = self._head
+        if self._count == self.max_experiences:
+            self._update_action_aggregates(
+                self._action_names[self._actions[slot]], float(self._rewards[slot]), -1
+            )
+        self._update_action_aggregates(action, reward, 1)
 
-        self.experiences.append(experience)
+        self._rewards[slot] = reward
+        self._actions[slot] = action_code
+        self._timestamps_ns[slot] = time.time_ns()
+        self._states[slot] = state
+        self._next_states[slot] = next_state
+        self._contexts[slot] = context
+        self._encode_state_keys(slot, state)
 
-        # Maintain experience limit
-        if len(self.experiences) > self.max_experiences:
-            self.experiences = self.experiences[-self.max_experiences:]
+        self._head = (slot + 1) % self.max_experiences
+        self._count = min(self._count + 1, self.max_experiences)
 
         # Update learning metrics
         self.learning_metrics["total_experiences"] += 1
@@ -188,69 +292,95 @@ class AdaptiveLearning:
             return "no_action"
 
         # Exploration vs exploitation
-        if random.random() < self.exploration_rate:
+        if self._next_uniform() < self.exploration_rate:
             # Explore: random action
-            return random.choice(available_actions)
+            return available_actions[self._next_choice(len(available_actions))]
         else:
             # Exploit: best known action
             return self._get_best_action(state, available_actions)
 
-    def _get_best_action(self, state: Dict[str, Any], available_actions: List[str]) -> str:
+    def _next_uniform(self) -> float:
+        """Draw a uniform [0, 1) sample from the pre-generated pool"""
+        if self._uniform_index == len(self._uniform_pool):
+            self._uniform_pool = self._rng.random(self.random_pool_size)
+            self._uniform_index = 0
+
+        value = self._uniform_pool[self._uniform_index]
+        self._uniform_index += 1
+        return value
+
+    def _next_choice(self, n: int) -> int:
+        """Draw a random index below n from the shared uniform pool"""
+        # Scaling a pooled uniform works for any n, so changing action-set
+        # sizes never discard a pre-generated batch
+        return min(int(self._next_uniform() * n), n - 1)
+
+    def _get_best_action(self, state: Dict[str, Any], available_actions: List[str],
+                         similarity_threshold: float = 0.8) -> str:
         """Get the best action based on learned knowledge"""
-        # Simplified Q-learning approach
+        # Cold start: with no relevant experience every action scores 0.0,
+        # so skip the similarity scans and explore instead
+        if self._count < 5 or not any(self._action_count.get(action) for action in available_actions):
+            return available_actions[self._next_choice(len(available_actions))]
+
+        # Simplified Q-learning approach: one similarity pass over all
+        # experiences, then per-action average reward of the similar ones
+        count = self._count
+        similarity = _jaccard_batch(
+            self._key_matrix[:count], self._encode_query(state), self._key_counts[:count], len(state)
+        )
+        similar = similarity >= similarity_threshold
+        similar_actions = self._actions[:count][similar]
+        reward_sums = np.bincount(
+            similar_actions, weights=self._rewards[:count][similar], minlength=len(self._action_names)
+        )
+        similar_counts = np.bincount(similar_actions, minlength=len(self._action_names))
+
         action_values = {}
 
         for action in available_actions:
-            # Calculate expected value based on similar experiences
-            similar_experiences = self._find_similar_experiences(state, action)
-            if similar_experiences:
-                avg_reward = sum(exp.reward for exp in similar_experiences) / len(similar_experiences)
-                action_values[action] = avg_reward
+            action_code = self._action_vocab.get(action)
+            if action_code is not None and similar_counts[action_code]:
+                action_values[action] = float(reward_sums[action_code] / similar_counts[action_code])
             else:
                 action_values[action] = 0.0  # Default value
 
         # Return action with highest expected value
         if not action_values:
-            return random.choice(available_actions)
+            return available_actions[self._next_choice(len(available_actions))]
         # action_values is a dict {action: value}, so get the action with max value
         return max(action_values, key=lambda k: action_values[k])
 
-    def _find_similar_experiences(self, state: Dict[str, Any], action: str,
-                                similarity_threshold: float = 0.8) -> List[LearningExperience]:
-        """Find experiences similar to current state and action"""
-        similar_experiences = []
-
-        for exp in self.experiences:
-            if exp.action != action:
-                continue
-
-            # Calculate state similarity (simplified)
-            similarity = self._calculate_state_similarity(state, exp.state)
-            if similarity >= similarity_threshold:
-                similar_experiences.append(exp)
-
-        return similar_experiences
-
-    def _calculate_state_similarity(self, state1: Dict[str, Any], state2: Dict[str, Any]) -> float:
-        """Calculate similarity between two states"""
-        if not state1 or not state2:
-            return 0.0
-
-        # Simple key-based similarity
-        keys1 = set(state1.keys())
-        keys2 = set(state2.keys())
-
-        if not keys1 or not keys2:
-            return 0.0
-
-        # Jaccard similarity of keys
-        intersection = len(keys1.intersection(keys2))
-        union = len(keys1.union(keys2))
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+    def _encode_state_keys(self, slot: int, state: Dict[str, Any]):
+        """Record the state's keys in the key-membership matrix row for a slot"""
+        key_set = frozenset(state or ())
+        columns = self._key_set_columns.get(key_set)
+        if columns is None:
+            for key in key_set:
+                if key not in self._key_vocab:
+                    self._key_vocab[key] = len(self._key_vocab)
+            columns = np.array([self._key_vocab[key] for key in key_set], dtype=np.intp)
+            self._key_set_columns[key_set] = columns
+
+        width = self._key_matrix.shape[1]
+        if len(self._key_vocab) > width:
+            grown = np.zeros((self.max_experiences, max(width * 2, len(self._key_vocab))), dtype=bool)
+            grown[:, :width] = self._key_matrix
+            self._key_matrix = grown
+
+        self._key_matrix[slot] = False
+        self._key_matrix[slot, columns] = True
+        self._key_counts[slot] = len(columns)
+
+    def _encode_query(self, state: Dict[str, Any]) -> np.ndarray:
+        """Encode a query state's keys as a key-membership row"""
+        # Keys unknown to the vocabulary cannot match; they only widen the union
+        query = np.zeros(self._key_matrix.shape[1], dtype=bool)
+        columns = self._key_set_columns.get(frozenset(state))
+        if columns is None:
+            columns = [self._key_vocab[key] for key in state if key in self._key_vocab]
+        query[columns] = True
+        return query
 
     def learn_from_experiences(self, batch_size: int = 100):
         """
@@ -259,27 +389,40 @@ class AdaptiveLearning:
         Args:
             batch_size: Number of experiences to process
         """
-        if len(self.experiences) < batch_size:
+        if self._count < batch_size:
             return
 
+        now = datetime.now()
+
         # Get recent experiences
-        recent_experiences = self.experiences[-batch_size:]
+        recent_slots = self._recent_slots(batch_size)
 
         # Extract patterns and knowledge
-        patterns = self._extract_patterns(recent_experiences)
-        knowledge_updates = self._distill_knowledge(patterns)
+        patterns = self._extract_patterns(recent_slots)
+        knowledge_updates = self._distill_knowledge(patterns, now)
+
+        # Update existing knowledge as one block
+        updated_concepts = [concept for concept in knowledge_updates if concept in self.knowledge_base]
+        if updated_concepts:
+            existing = [self.knowledge_base[concept] for concept in updated_concepts]
+            count = len(existing)
+            confidences = np.fromiter((k.confidence for k in existing), dtype=np.float64, count=count)
+            evidence = np.fromiter((k.evidence_count for k in existing), dtype=np.float64, count=count)
+            new_confidences = np.fromiter(
+                (knowledge_updates[concept].confidence for concept in updated_concepts),
+                dtype=np.float64, count=count
+            )
+            blended = ((confidences * evidence + new_confidences) / (evidence + 1)).tolist()
+
+            for concept, knowledge, confidence in zip(updated_concepts, existing, blended):
+                knowledge.confidence = confidence
+                knowledge.evidence_count += 1
+                knowledge.last_updated = now
+                knowledge.related_concepts.update(knowledge_updates[concept].related_concepts)
 
-        # Update knowledge base
+        # Add new knowledge
         for concept, knowledge in knowledge_updates.items():
-            if concept in self.knowledge_base:
-                # Update existing knowledge
-                existing = self.knowledge_base[concept]
-                existing.confidence = (existing.confidence * existing.evidence_count + knowledge.confidence) / (existing.evidence_count + 1)
-                existing.evidence_count += 1
-                existing.last_updated = datetime.now()
-                existing.related_concepts.update(knowledge.related_concepts)
-            else:
-                # Add new knowledge
+            if concept not in self.knowledge_base:
                 self.knowledge_base[concept] = knowledge
 
         # Update learning efficiency
@@ -288,34 +431,49 @@ class AdaptiveLearning:
 
         print(f"🧠 Learned {len(knowledge_updates)} new concepts from {batch_size} experiences")
 
-    def _extract_patterns(self, experiences: List[LearningExperience]) -> List[Dict[str, Any]]:
-        """Extract patterns from experiences"""
+    def _extract_patterns(self, slots: np.ndarray) -> List[Dict[str, Any]]:
+        """Extract patterns from the experiences stored in the given slots"""
         patterns = []
+        if not slots.size:
+            return patterns
+
+        # Partition experiences into contiguous per-action segments
+        actions = self._actions[slots]
+        order = np.argsort(actions, kind="stable")
+        sorted_slots = slots[order]
+        action_codes, starts, group_sizes = np.unique(
+            actions[order], return_index=True, return_counts=True
+        )
+        if len(slots) == self._count:
+            # The batch spans every retained experience: reuse running aggregates
+            action_names = [self._action_names[code] for code in action_codes]
+            reward_sums = np.array([self._action_reward_sum[name] for name in action_names])
+            success_counts = np.array([self._action_success.get(name, 0) for name in action_names])
+        else:
+            sorted_rewards = self._rewards[sorted_slots]
+            reward_sums = np.add.reduceat(sorted_rewards, starts)
+            success_counts = np.add.reduceat((sorted_rewards > 0).astype(np.int32), starts)
 
-        # Group experiences by action
-        action_groups = defaultdict(list)
-        for exp in experiences:
-            action_groups[exp.action].append(exp)
-
-        for action, action_experiences in action_groups.items():
-            if len(action_experiences) < 5:
+        for group, action_code in enumerate(action_codes):
+            frequency = int(group_sizes[group])
+            if frequency < 5:
                 continue
 
             # Calculate action success rate
-            successful_exps = [exp for exp in action_experiences if exp.reward > 0]
-            success_rate = len(successful_exps) / len(action_experiences)
+            success_rate = float(success_counts[group]) / frequency
 
             # Calculate average reward
-            avg_reward = sum(exp.reward for exp in action_experiences) / len(action_experiences)
+            avg_reward = float(reward_sums[group]) / frequency
 
             # Find common state features
-            common_features = self._find_common_features(action_experiences)
+            start = starts[group]
+            common_features = self._find_common_features(sorted_slots[start:start + frequency])
 
             pattern = {
-                "action": action,
+                "action": self._action_names[action_code],
                 "success_rate": success_rate,
                 "average_reward": avg_reward,
-                "frequency": len(action_experiences),
+                "frequency": frequency,
                 "common_features": common_features,
                 "confidence": min(success_rate * 1.2, 1.0)  # Boost successful patterns
             }
@@ -324,39 +482,48 @@ class AdaptiveLearning:
 
         return patterns
 
-    def _find_common_features(self, experiences: List[LearningExperience]) -> Dict[str, Any]:
-        """Find features common across experiences"""
-        if not experiences:
+    def _find_common_features(self, slots: np.ndarray) -> Dict[str, Any]:
+        """Find features common across the experiences stored in the given slots"""
+        if not slots.size:
             return {}
 
-        # Collect all state features
-        all_features = defaultdict(list)
+        states = self._states[slots]
 
-        for exp in experiences:
-            for key, value in exp.state.items():
-                all_features[key].append(value)
+        # Discover the key universe in first-seen order
+        feature_keys: Dict[str, None] = {}
+        for state in states:
+            feature_keys.update(dict.fromkeys(state))
 
         # Find features that are consistent
         common_features = {}
 
-        for key, values in all_features.items():
+        for key in feature_keys:
+            values = [state[key] for state in states if key in state]
             if len(values) < 2:
                 continue
 
             # Check if values are similar (for numeric) or identical (for categorical)
             if all(isinstance(v, (int, float)) for v in values):
                 # Numeric: check variance
-                variance = np.var(values)
-                if variance < np.mean(values) * 0.1:  # Low variance
+                numeric = np.fromiter(values, dtype=np.float64, count=len(values))
+                mean = numeric.mean()
+                variance = numeric.var()
+                if variance < mean * 0.1:  # Low variance
                     common_features[key] = {
                         "type": "numeric",
-                        "mean": np.mean(values),
+                        "mean": mean,
                         "variance": variance
                     }
             else:
                 # Categorical: check if most values are the same
-                most_common = max(set(values), key=values.count)
-                frequency = values.count(most_common) / len(values)
+                categories: Dict[Any, int] = {}
+                codes = np.fromiter(
+                    (categories.setdefault(v, len(categories)) for v in values),
+                    dtype=np.int32, count=len(values)
+                )
+                top, frequency = _mode_and_freq(codes)
+                most_common = list(categories)[int(top)]
+                frequency = float(frequency)
                 if frequency > 0.8:  # 80% agreement
                     common_features[key] = {
                         "type": "categorical",
@@ -366,8 +533,12 @@ class AdaptiveLearning:
 
         return common_features
 
-    def _distill_knowledge(self, patterns: List[Dict[str, Any]]) -> Dict[str, LearnedKnowledge]:
+    def _distill_knowledge(self, patterns: List[Dict[str, Any]],
+                           now: Optional[datetime] = None) -> Dict[str, LearnedKnowledge]:
         """Distill knowledge from patterns"""
+        if now is None:
+            now = datetime.now()
+
         knowledge_updates = {}
 
 
@@ -389,7 +560,7 @@ class AdaptiveLearning:
                 concept=concept,
                 confidence=confidence,
                 evidence_count=pattern["frequency"],
-                last_updated=datetime.now(),
+                last_updated=now,
                 related_concepts=related_concepts,
                 performance_metrics={
                     "success_rate": pattern["success_rate"],
@@ -422,6 +593,7 @@ class AdaptiveLearning:
 
         # Adapt knowledge for target domain
         adapted_knowledge = {}
+        now = datetime.now()
 
         for concept, knowledge in source_knowledge.items():
             # Replace source domain with target domain in concept name
@@ -434,7 +606,7 @@ class AdaptiveLearning:
                 concept=target_concept,
                 confidence=adapted_confidence,
                 evidence_count=knowledge.evidence_count,
-                last_updated=datetime.now(),
+                last_updated=now,
                 related_concepts=knowledge.related_concepts.copy(),
                 performance_metrics=knowledge.performance_metrics.copy()
             )
@@ -450,7 +622,9 @@ class AdaptiveLearning:
         if len(self.performance_history) < 10:
             return
 
-        recent_performance = list(self.performance_history)[-10:]
+        recent_performance = list(itertools.islice(
+            self.performance_history, len(self.performance_history) - 10, None
+        ))
         avg_performance = sum(recent_performance) / len(recent_performance)
 
         # Identify performance bottlenecks
@@ -558,27 +732,38 @@ class AdaptiveLearning:
             "current_phase": self.current_phase.value
         }
 
-    def get_knowledge_base_summary(self) -> Dict[str, Any]:
-        """Get summary of learned knowledge"""
+    def get_knowledge_base_summary(self, include_timestamps: bool = True) -> Dict[str, Any]:
+        """
+        Get summary of learned knowledge.
+
+        Args:
+            include_timestamps: Include each concept's last_updated timestamp
+        """
         if not self.knowledge_base:
             return {"total_concepts": 0, "average_confidence": 0, "concepts": []}
 
-        concepts = []
-        total_confidence = 0
+        total_concepts = len(self.knowledge_base)
+        confidences = np.fromiter(
+            (knowledge.confidence for knowledge in self.knowledge_base.values()),
+            dtype=np.float64, count=total_concepts
+        )
+        rounded_confidences = np.round(confidences, 3).tolist()
 
-        for concept, knowledge in self.knowledge_base.items():
-            concepts.append({
+        concepts = [None] * total_concepts
+        for i, (concept, knowledge) in enumerate(self.knowledge_base.items()):
+            entry = {
                 "concept": concept,
-                "confidence": round(knowledge.confidence, 3),
-                "evidence_count": knowledge.evidence_count,
-                "last_updated": knowledge.last_updated.isoformat(),
-                "related_concepts": list(knowledge.related_concepts)
-            })
-            total_confidence += knowledge.confidence
+                "confidence": rounded_confidences[i],
+                "evidence_count": knowledge.evidence_count
+            }
+            if include_timestamps:
+                entry["last_updated"] = knowledge.last_updated.isoformat()
+            entry["related_concepts"] = list(knowledge.related_concepts)
+            concepts[i] = entry
 
         return {
-            "total_concepts": len(self.knowledge_base),
-            "average_confidence": round(total_confidence / len(self.knowledge_base), 3),
+            "total_concepts": total_concepts,
+            "average_confidence": round(float(confidences.sum()) / total_concepts, 3),
             "concepts": concepts
         }
 
@@ -593,12 +778,16 @@ class AdaptiveLearning:
             "timestamp": datetime.now().isoformat(),
             "learning_metrics": self.get_learning_metrics(),
             "knowledge_base": self.get_knowledge_base_summary(),
-            "experiences_count": len(self.experiences)
+            "experiences_count": self._count
         }
 
         try:
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(export_data, f, indent=2, default=str)
             print(f"💾 Knowledge exported to {filepath}")
         except Exception as e:
             print(f"❌ Failed to export knowledge: {e}")
@@ -635,9 +824,10 @@ class AdaptiveLearning:
 
     def reset_learning(self):
         """Reset the learning system"""
-        self.experiences.clear()
-        self.knowledge_base.clear()
-        self.learning_models.clear()
+        # Swap in fresh containers rather than clearing the old ones in place
+        self._init_experience_buffer()
+        self.knowledge_base = {}
+        self.learning_models = {}
         self.exploration_rate = 0.3
         self.learning_metrics = {
             "total_experiences": 0,
@@ -651,7 +841,7 @@ class AdaptiveLearning:
     def get_system_health(self) -> Dict[str, Any]:
         """Get adaptive learning system health"""
         return {
-            "experiences_count": len(self.experiences),
+            "experiences_count": self._count,
             "knowledge_concepts": len(self.knowledge_base),
             "learning_metrics": self.get_learning_metrics(),
             "current_phase": self.current_phase.value,
@@ -8,13 +8,14 @@ including automated decision making, self-optimization, and independent executio
 """
 
 import asyncio
+import itertools
 import threading
 import time
-from typing import Dict, Any, List, Optional, Callable, Tuple, Set
+from typing import Dict, Any, List, Optional, Callable, Tuple, Set, Mapping, Sequence
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict, deque
+from collections import Counter, OrderedDict, defaultdict, deque
 import random
 import json
 import logging
@@ -22,6 +23,87 @@ from concurrent.futures import ThreadPoolExecutor
 import psutil
 import os
 
+logger = logging.getLogger(__name__)
+
+# Fast JSON serialization for history export (optional import)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> str:
+    """Fallback encoder: ISO datetimes, str() for anything else"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON, in C when orjson is available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+async def _yield():
+    """Let other tasks run without adding a delay (sleep(0) fast path)"""
+    await asyncio.sleep(0)
+
+
+# Numeric risk per action risk label; unknown labels count as 0.5
+RISK_LEVELS = {"low": 0.1, "medium": 0.3, "high": 0.7}
+
+# Fixed action plans, shared read-only by every decision that uses them
+RESOURCE_ACTIONS: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    "cpu": (
+        {
+            "action": "reduce_thread_pool",
+            "description": "Reduce thread pool size to lower CPU usage",
+            "risk": "low"
+        },
+        {
+            "action": "optimize_background_tasks",
+            "description": "Optimize background task scheduling",
+            "risk": "medium"
+        }
+    ),
+    "memory": (
+        {
+            "action": "clear_caches",
+            "description": "Clear non-essential caches to free memory",
+            "risk": "low"
+        },
+        {
+            "action": "reduce_buffer_sizes",
+            "description": "Reduce buffer sizes for memory optimization",
+            "risk": "medium"
+        }
+    )
+}
+
+# (health metric, resource name) pairs checked for critical usage spikes
+SPIKE_SPECS = (
+    ("cpu_percent", "cpu"),
+    ("memory_percent", "memory"),
+    ("disk_percent", "disk")
+)
+SPIKE_THRESHOLD = 95
+
+LEARNING_ACTIONS: Tuple[Dict[str, Any], ...] = (
+    {
+        "action": "increase_learning_rate",
+        "description": "Increase learning batch size for better pattern recognition",
+        "risk": "low"
+    },
+    {
+        "action": "enable_transfer_learning",
+        "description": "Enable transfer learning to accelerate knowledge acquisition",
+        "risk": "low"
+    }
+)
+
 
 class OperationMode(Enum):
     """Autonomous operation modes"""
@@ -41,7 +123,7 @@ class DecisionType(Enum):
     ADAPTATION = "adaptation"
 
 
-@dataclass
+@dataclass(slots=True)
 class AutonomousDecision:
     """
     An autonomous decision made by the system.
@@ -49,19 +131,28 @@ class AutonomousDecision:
     decision_id: str
     decision_type: DecisionType
     description: str
-    actions: List[Dict[str, Any]]
+    actions: Sequence[Mapping[str, Any]]  # treat as read-only; plans may be shared
     confidence: float
     expected_impact: str
-    timestamp: datetime
+    timestamp_epoch: float  # time.time() at creation
     executed: bool = False
     result: Optional[Dict[str, Any]] = None
+    type_value: str = field(default="", init=False, repr=False, compare=False)  # decision_type.value
+    iso_timestamp: str = field(default="", init=False, repr=False, compare=False)  # timestamp.isoformat()
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        if self.timestamp_epoch is None:
+            self.timestamp_epoch = time.time()
+        self.type_value = self.decision_type.value
+        self.iso_timestamp = self.timestamp.isoformat()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a datetime, built on demand"""
+        return datetime.fromtimestamp(self.timestamp_epoch)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemGoal:
     """
     A system goal for autonomous operations.
@@ -73,10 +164,13 @@ class SystemGoal:
     deadline: Optional[datetime]
     status: str = "active"  # active, achieved, failed, cancelled
     progress: float = 0.0
+    _deadline_ts: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.deadline is None:
             self.deadline = datetime.now() + timedelta(days=7)
+        # Epoch seconds of the deadline, for cheap comparisons while pursuing
+        self._deadline_ts = self.deadline.timestamp()
 
 
 class AutonomousOperations:
@@ -87,6 +181,14 @@ class AutonomousOperations:
     execution of system operations.
     """
 
+    # (decision_threshold, risk_tolerance) applied by each operation mode
+    _MODE_PARAMS: Dict[OperationMode, Tuple[float, float]] = {
+        OperationMode.FULL_AUTONOMY: (0.8, 0.2),
+        OperationMode.SUPERVISED_AUTONOMY: (0.7, 0.3),
+        OperationMode.HYBRID_AUTONOMY: (0.6, 0.4),
+        OperationMode.MANUAL_OVERRIDE: (1.0, 0.0),  # Require perfect confidence
+    }
+
     def __init__(self, lifecycle_controller, self_repair, adaptive_learning):
         """
         Initialize autonomous operations.
@@ -102,13 +204,21 @@ class AutonomousOperations:
 
         # Operation mode
         self.operation_mode = OperationMode.SUPERVISED_AUTONOMY
+        self._operation_mode_value = self.operation_mode.value
 
         # Decision history
-        self.decisions: List[AutonomousDecision] = []
         self.max_decisions = 1000
+        self.decisions: deque = deque(maxlen=self.max_decisions)
+        self._recent_decision_times: deque = deque(maxlen=self.max_decisions)  # time.monotonic() per decision
+        self._decision_type_counts: Counter = Counter()  # lifetime totals, not bounded by the deque
 
         # System goals
         self.system_goals: Dict[str, SystemGoal] = {}
+        self._active_goal_ids: Dict[str, None] = {}  # insertion-ordered set of active goals
+
+        # Opportunities keyed on the state facts they are derived from (LRU)
+        self._opportunity_cache: OrderedDict = OrderedDict()
+        self.opportunity_cache_size = 128
 
         # Autonomous tasks
         self.autonomous_tasks: Dict[str, asyncio.Task] = {}
@@ -138,8 +248,20 @@ class AutonomousOperations:
         # Autonomous monitoring
         self.monitoring_active = False
         self.monitoring_interval = 60  # seconds
+        self.decision_interval = 300  # Every 5 minutes
+        self.goal_pursuit_interval = 600  # Every 10 minutes
+
+        # System sampling: boot time never changes; the latest tick's psutil
+        # readings are shared by health checks and resource-limit checks
+        self._boot_time = psutil.boot_time()
+        self._last_sample: Dict[str, Any] = {}
+        self._last_sample_at = float("-inf")  # time.monotonic() of _last_sample
+        self.sample_ttl = 5.0  # seconds a sample is reused for
+        # Dedicated single thread for psutil reads (created on demand)
+        self._telemetry_executor: Optional[ThreadPoolExecutor] = None
+        psutil.cpu_percent(interval=None)  # prime the non-blocking CPU counter
 
-        print("🤖 Autonomous Operations initialized")
+        logger.info("Autonomous Operations initialized")
 
     def set_operation_mode(self, mode: OperationMode):
         """
@@ -150,22 +272,13 @@ class AutonomousOperations:
         """
         old_mode = self.operation_mode
         self.operation_mode = mode
+        self._operation_mode_value = mode.value
 
-        print(f"🔄 Operation mode changed: {old_mode.value} → {mode.value}")
+        logger.info("Operation mode changed: %s -> %s", old_mode.value, mode.value)
+        self._opportunity_cache.clear()
 
         # Adjust parameters based on mode
-        if mode == OperationMode.FULL_AUTONOMY:
-            self.decision_threshold = 0.8
-            self.risk_tolerance = 0.2
-        elif mode == OperationMode.SUPERVISED_AUTONOMY:
-            self.decision_threshold = 0.7
-            self.risk_tolerance = 0.3
-        elif mode == OperationMode.HYBRID_AUTONOMY:
-            self.decision_threshold = 0.6
-            self.risk_tolerance = 0.4
-        elif mode == OperationMode.MANUAL_OVERRIDE:
-            self.decision_threshold = 1.0  # Require perfect confidence
-            self.risk_tolerance = 0.0
+        self.decision_threshold, self.risk_tolerance = self._MODE_PARAMS[mode]
 
     def add_system_goal(self, goal_id: str, description: str, priority: int,
                        target_metrics: Dict[str, float], deadline: Optional[datetime] = None):
@@ -188,7 +301,8 @@ class AutonomousOperations:
         )
 
         self.system_goals[goal_id] = goal
-        print(f"🎯 Added system goal: {goal_id} (priority {priority})")
+        self._active_goal_ids[goal_id] = None
+        logger.info("Added system goal: %s (priority %s)", goal_id, priority)
 
     def remove_system_goal(self, goal_id: str):
         """
@@ -199,7 +313,8 @@ class AutonomousOperations:
         """
         if goal_id in self.system_goals:
             del self.system_goals[goal_id]
-            print(f"❌ Removed system goal: {goal_id}")
+            self._active_goal_ids.pop(goal_id, None)
+            logger.info("Removed system goal: %s", goal_id)
 
     def start_autonomous_operations(self):
         """Start autonomous operation tasks"""
@@ -208,16 +323,16 @@ class AutonomousOperations:
 
         self.running = True
 
-        # Start monitoring task
-        self.autonomous_tasks["monitoring"] = asyncio.create_task(self._monitoring_loop())
-
-        # Start decision making task
-        self.autonomous_tasks["decision_making"] = asyncio.create_task(self._decision_making_loop())
+        # Eager tasks (Python 3.12+) run synchronously until their first
+        # suspension, so coroutines that never block skip the scheduler
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            loop.set_task_factory(asyncio.eager_task_factory)
 
-        # Start goal pursuit task
-        self.autonomous_tasks["goal_pursuit"] = asyncio.create_task(self._goal_pursuit_loop())
+        # Monitoring, decision making and goal pursuit share one scheduler task
+        self.autonomous_tasks["scheduler"] = asyncio.create_task(self._scheduler_loop())
 
-        print("🚀 Autonomous operations started")
+        logger.info("Autonomous operations started")
 
     def stop_autonomous_operations(self):
         """Stop autonomous operation tasks"""
@@ -227,51 +342,58 @@ class AutonomousOperations:
             task.cancel()
 
         self.autonomous_tasks.clear()
-        print("🛑 Autonomous operations stopped")
 
-    async def _monitoring_loop(self):
-        """Main monitoring loop for autonomous operations"""
-        while self.running:
-            try:
-                await self._perform_system_monitoring()
-                await asyncio.sleep(self.monitoring_interval)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"⚠️  Monitoring error: {e}")
-                await asyncio.sleep(10)
+        if self._telemetry_executor is not None:
+            self._telemetry_executor.shutdown(wait=False)
+            self._telemetry_executor = None
 
-    async def _decision_making_loop(self):
-        """Decision making loop for autonomous operations"""
-        while self.running:
-            try:
-                await self._evaluate_and_make_decisions()
-                await asyncio.sleep(300)  # Every 5 minutes
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"⚠️  Decision making error: {e}")
-                await asyncio.sleep(60)
+        logger.info("Autonomous operations stopped")
+
+    async def _scheduler_loop(self):
+        """
+        Run every periodic job from a single timer.
+
+        Sleeps until the earliest job is due, runs the due jobs, and
+        reschedules each one after its interval (or its error backoff).
+        """
+        # (label, handler, interval attribute, backoff after an error)
+        jobs = (
+            ("Monitoring", self._perform_system_monitoring, "monitoring_interval", 10),
+            ("Decision making", self._evaluate_and_make_decisions, "decision_interval", 60),
+            ("Goal pursuit", self._pursue_system_goals, "goal_pursuit_interval", 120),
+        )
+        next_run = [time.monotonic()] * len(jobs)
 
-    async def _goal_pursuit_loop(self):
-        """Goal pursuit loop for autonomous operations"""
         while self.running:
             try:
-                await self._pursue_system_goals()
-                await asyncio.sleep(600)  # Every 10 minutes
+                delay = min(next_run) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Jobs already due (e.g. overran their interval): run them
+                    # right away, but still give other tasks a turn first
+                    await _yield()
+
+                now = time.monotonic()
+                for i, (label, handler, interval_attr, backoff) in enumerate(jobs):
+                    if next_run[i] > now:
+                        continue
+                    try:
+                        await handler()
+                        next_run[i] = time.monotonic() + getattr(self, interval_attr)
+                    except Exception as e:
+                        logger.warning("%s error: %s", label, e)
+                        next_run[i] = time.monotonic() + backoff
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                print(f"⚠️  Goal pursuit error: {e}")
-                await asyncio.sleep(120)
 
     async def _perform_system_monitoring(self):
         """Perform comprehensive system monitoring"""
         # Get system metrics
         system_health = await self._get_system_health()
 
-        # Check resource usage
-        resource_status = self._check_resource_usage()
+        # Check resource usage against the same sample
+        resource_status = self._check_resource_usage(system_health)
 
         # Monitor component health
         component_health = await self.lifecycle_controller.get_component_health()
@@ -286,57 +408,78 @@ class AutonomousOperations:
         if anomalies:
             await self._respond_to_anomalies(anomalies)
 
+    def _sample_system(self) -> Dict[str, Any]:
+        """Read every psutil metric, reusing the last reading for sample_ttl seconds"""
+        now = time.monotonic()
+        if now - self._last_sample_at < self.sample_ttl:
+            return self._last_sample
+
+        # CPU usage since the previous sample; never blocks the event loop
+        cpu_percent = psutil.cpu_percent(interval=None)
+
+        # Memory and disk usage
+        memory_percent = psutil.virtual_memory().percent
+        disk_percent = psutil.disk_usage('/').percent
+
+        # Network I/O
+        network = psutil.net_io_counters()
+
+        # System uptime
+        uptime_hours = (time.time() - self._boot_time) / 3600
+
+        sample = {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory_percent,
+            "disk_percent": disk_percent,
+            "bytes_sent": network.bytes_sent,
+            "bytes_recv": network.bytes_recv,
+            "uptime_hours": uptime_hours,
+            "timestamp": time.time()
+        }
+        self._last_sample = sample
+        self._last_sample_at = now
+        return sample
+
     async def _get_system_health(self) -> Dict[str, Any]:
         """Get comprehensive system health metrics"""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = disk.percent
-
-            # Network I/O
-            network = psutil.net_io_counters()
-            bytes_sent = network.bytes_sent
-            bytes_recv = network.bytes_recv
-
-            # System uptime
-            uptime_seconds = time.time() - psutil.boot_time()
-            uptime_hours = uptime_seconds / 3600
-
-            return {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory_percent,
-                "disk_percent": disk_percent,
-                "bytes_sent": bytes_sent,
-                "bytes_recv": bytes_recv,
-                "uptime_hours": uptime_hours,
-                "timestamp": datetime.now()
-            }
-
+            if time.monotonic() - self._last_sample_at < self.sample_ttl:
+                return self._last_sample
+
+            # /proc and filesystem reads can stall; keep them off the event loop
+            if self._telemetry_executor is None:
+                self._telemetry_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="vault-telemetry"
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._telemetry_executor, self._sample_system)
         except Exception as e:
-            print(f"⚠️  Failed to get system health: {e}")
+            logger.warning("Failed to get system health: %s", e)
             return {}
 
-    def _check_resource_usage(self) -> Dict[str, Any]:
-        """Check if resource usage exceeds limits"""
+    def _check_resource_usage(self, system_health: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Check if resource usage exceeds limits.
+
+        Args:
+            system_health: Sample to check; defaults to a fresh (or cached) one
+
+        Returns:
+            Over-limit flags and the usage percentages they were based on
+        """
         try:
-            cpu_percent = psutil.cpu_percent()
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            sample = self._sample_system() if system_health is None else system_health
+            cpu_percent = sample["cpu_percent"]
+            memory_percent = sample["memory_percent"]
+            disk_percent = sample["disk_percent"]
 
             return {
                 "cpu_over_limit": cpu_percent > self.resource_limits["cpu_percent"],
-                "memory_over_limit": memory.percent > self.resource_limits["memory_percent"],
-                "disk_over_limit": disk.percent > self.resource_limits["disk_percent"],
+                "memory_over_limit": memory_percent > self.resource_limits["memory_percent"],
+                "disk_over_limit": disk_percent > self.resource_limits["disk_percent"],
                 "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "disk_percent": disk.percent
+                "memory_percent": memory_percent,
+                "disk_percent": disk_percent
             }
 
         except Exception as e:
@@ -364,21 +507,55 @@ class AutonomousOperations:
         component_health = await self.lifecycle_controller.get_component_health()
         learning_metrics = self.adaptive_learning.get_learning_metrics()
 
+        # Drop decision times older than an hour; what remains is the count
+        recent_times = self._recent_decision_times
+        cutoff = time.monotonic() - 3600
+        while recent_times and recent_times[0] < cutoff:
+            recent_times.popleft()
+
         return {
             "system_health": system_health,
             "component_health": component_health,
             "learning_metrics": learning_metrics,
-            "active_goals": len([g for g in self.system_goals.values() if g.status == "active"]),
-            "recent_decisions": len([d for d in self.decisions if (datetime.now() - d.timestamp).seconds < 3600])
+            "active_goals": len(self._active_goal_ids),
+            "recent_decisions": len(recent_times)
         }
 
     def _identify_optimization_opportunities(self, system_state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify opportunities for system optimization"""
+        # Check resource usage from the sample taken while assessing state
+        resource_status = self._check_resource_usage(system_state.get("system_health"))
+        cpu_over = resource_status.get("cpu_over_limit", False)
+        memory_over = resource_status.get("memory_over_limit", False)
+
+        # Check component health
+        component_health = system_state.get("component_health", {})
+        unhealthy_components = [
+            comp for comp, health in component_health.items()
+            if health.get("status") not in ["healthy", "good"]
+        ]
+
+        # Check learning efficiency
+        learning_metrics = system_state.get("learning_metrics", {})
+        learning_efficiency = learning_metrics.get("learning_efficiency", 0)
+        learning_low = learning_efficiency < 0.5
+
+        # States that agree on every fact (at the precision shown in the
+        # descriptions) produce the same opportunities, so reuse them
+        state_key = (
+            round(resource_status["cpu_percent"], 1) if cpu_over else None,
+            round(resource_status["memory_percent"], 1) if memory_over else None,
+            tuple(unhealthy_components),
+            round(learning_efficiency, 2) if learning_low else None
+        )
+        cached = self._opportunity_cache.get(state_key)
+        if cached is not None:
+            self._opportunity_cache.move_to_end(state_key)
+            return cached
+
         opportunities = []
 
-        # Check resource usage
-        resource_status = self._check_resource_usage()
-        if resource_status.get("cpu_over_limit"):
+        if cpu_over:
             opportunities.append({
                 "type": "resource_optimization",
                 "category": "cpu",
@@ -386,7 +563,7 @@ class AutonomousOperations:
                 "description": f"CPU usage at {resource_status['cpu_percent']:.1f}% exceeds limit"
             })
 
-        if resource_status.get("memory_over_limit"):
+        if memory_over:
             opportunities.append({
                 "type": "resource_optimization",
                 "category": "memory",
@@ -394,13 +571,6 @@ class AutonomousOperations:
                 "description": f"Memory usage at {resource_status['memory_percent']:.1f}% exceeds limit"
             })
 
-        # Check component health
-        component_health = system_state.get("component_health", {})
-        unhealthy_components = [
-            comp for comp, health in component_health.items()
-            if health.get("status") not in ["healthy", "good"]
-        ]
-
         if unhealthy_components:
             opportunities.append({
                 "type": "component_health",
@@ -409,16 +579,17 @@ class AutonomousOperations:
                 "description": f"Unhealthy components: {', '.join(unhealthy_components)}"
             })
 
-        # Check learning efficiency
-        learning_metrics = system_state.get("learning_metrics", {})
-        learning_efficiency = learning_metrics.get("learning_efficiency", 0)
-        if learning_efficiency < 0.5:
+        if learning_low:
             opportunities.append({
                 "type": "learning_optimization",
                 "severity": "low",
                 "description": f"Learning efficiency at {learning_efficiency:.2f} could be improved"
             })
 
+        self._opportunity_cache[state_key] = opportunities
+        if len(self._opportunity_cache) > self.opportunity_cache_size:
+            self._opportunity_cache.popitem(last=False)
+
         return opportunities
 
     def _generate_decisions(self, opportunities: List[Dict[str, Any]]) -> List[AutonomousDecision]:
@@ -450,34 +621,7 @@ class AutonomousOperations:
 
     def _generate_resource_decision(self, category: str, severity: str) -> Optional[AutonomousDecision]:
         """Generate resource optimization decision"""
-        actions = []
-
-        if category == "cpu":
-            actions = [
-                {
-                    "action": "reduce_thread_pool",
-                    "description": "Reduce thread pool size to lower CPU usage",
-                    "risk": "low"
-                },
-                {
-                    "action": "optimize_background_tasks",
-                    "description": "Optimize background task scheduling",
-                    "risk": "medium"
-                }
-            ]
-        elif category == "memory":
-            actions = [
-                {
-                    "action": "clear_caches",
-                    "description": "Clear non-essential caches to free memory",
-                    "risk": "low"
-                },
-                {
-                    "action": "reduce_buffer_sizes",
-                    "description": "Reduce buffer sizes for memory optimization",
-                    "risk": "medium"
-                }
-            ]
+        actions = RESOURCE_ACTIONS.get(category)
 
         if actions:
             return AutonomousDecision(
@@ -487,7 +631,7 @@ class AutonomousOperations:
                 actions=actions,
                 confidence=0.75 if severity == "high" else 0.6,
                 expected_impact=f"Reduce {category} usage by 10-20%",
-                timestamp=datetime.now()
+                timestamp_epoch=time.time()
             )
 
         return None
@@ -513,34 +657,21 @@ class AutonomousOperations:
                 actions=actions,
                 confidence=0.8,
                 expected_impact="Restore component health and functionality",
-                timestamp=datetime.now()
+                timestamp_epoch=time.time()
             )
 
         return None
 
     def _generate_learning_decision(self, severity: str) -> Optional[AutonomousDecision]:
         """Generate learning optimization decision"""
-        actions = [
-            {
-                "action": "increase_learning_rate",
-                "description": "Increase learning batch size for better pattern recognition",
-                "risk": "low"
-            },
-            {
-                "action": "enable_transfer_learning",
-                "description": "Enable transfer learning to accelerate knowledge acquisition",
-                "risk": "low"
-            }
-        ]
-
         return AutonomousDecision(
             decision_id=f"learning_opt_{int(time.time())}",
             decision_type=DecisionType.OPTIMIZATION,
             description=f"Optimize learning efficiency ({severity} priority)",
-            actions=actions,
+            actions=LEARNING_ACTIONS,
             confidence=0.65,
             expected_impact="Improve learning efficiency by 15-25%",
-            timestamp=datetime.now()
+            timestamp_epoch=time.time()
         )
 
     async def _should_execute_decision(self, decision: AutonomousDecision) -> bool:
@@ -553,17 +684,15 @@ class AutonomousOperations:
         if decision.confidence < self.decision_threshold:
             return False
 
-        # Check risk tolerance
-        max_risk = max(action.get("risk", "low") for action in decision.actions)
-        risk_levels = {"low": 0.1, "medium": 0.3, "high": 0.7}
-
-        if risk_levels.get(max_risk, 0.5) > self.risk_tolerance:
-            return False
+        # Check risk tolerance: any single action above it rejects the decision
+        for action in decision.actions:
+            if RISK_LEVELS.get(action.get("risk", "low"), 0.5) > self.risk_tolerance:
+                return False
 
         # Additional checks based on operation mode
         if self.operation_mode == OperationMode.SUPERVISED_AUTONOMY:
             # In supervised mode, log decision for review
-            print(f"🤖 Decision pending approval: {decision.description} (confidence: {decision.confidence:.2f})")
+            logger.info("Decision pending approval: %s (confidence: %.2f)", decision.description, decision.confidence)
             # For now, auto-approve in supervised mode
             return True
 
@@ -571,7 +700,7 @@ class AutonomousOperations:
 
     async def _execute_decision(self, decision: AutonomousDecision):
         """Execute an autonomous decision"""
-        print(f"⚡ Executing autonomous decision: {decision.description}")
+        logger.info("Executing autonomous decision: %s", decision.description)
 
         results = []
 
@@ -585,15 +714,15 @@ class AutonomousOperations:
         # Update decision
         decision.executed = True
         decision.result = {
-            "execution_time": datetime.now(),
+            "execution_time": time.time(),
             "results": results,
             "overall_success": all(r["success"] for r in results)
         }
 
         # Record decision
-        self.decisions.append(decision)
-        if len(self.decisions) > self.max_decisions:
-            self.decisions = self.decisions[-self.max_decisions:]
+        self.decisions.append(decision)  # deque evicts beyond max_decisions
+        self._recent_decision_times.append(time.monotonic())
+        self._decision_type_counts[decision.type_value] += 1
 
         # Update performance metrics
         self.performance_metrics["decisions_made"] += 1
@@ -611,7 +740,7 @@ class AutonomousOperations:
             / total_decisions
         )
 
-        print(f"✅ Decision execution complete: {decision.result['overall_success']}")
+        logger.debug("Decision execution complete: %s", decision.result["overall_success"])
 
     async def _execute_action(self, action: Dict[str, Any]) -> Any:
         """Execute a specific action"""
@@ -672,26 +801,36 @@ class AutonomousOperations:
 
     async def _pursue_system_goals(self):
         """Pursue active system goals"""
-        for goal in self.system_goals.values():
-            if goal.status != "active":
+        now_ts = time.time()
+
+        # Snapshot: goals may be added or closed while actions are awaited
+        for goal_id in list(self._active_goal_ids):
+            goal = self.system_goals.get(goal_id)
+            if goal is None or goal.status != "active":
+                self._active_goal_ids.pop(goal_id, None)
                 continue
 
             # Check if goal is achieved
             if self._is_goal_achieved(goal):
-                goal.status = "achieved"
+                self._close_goal(goal, "achieved")
                 goal.progress = 1.0
-                print(f"🎯 Goal achieved: {goal.description}")
+                logger.info("Goal achieved: %s", goal.description)
                 continue
 
             # Check if goal is overdue
-            if goal.deadline and datetime.now() > goal.deadline:
-                goal.status = "failed"
-                print(f"❌ Goal failed (overdue): {goal.description}")
+            if now_ts > goal._deadline_ts:
+                self._close_goal(goal, "failed")
+                logger.warning("Goal failed (overdue): %s", goal.description)
                 continue
 
             # Take actions toward goal
             await self._take_goal_actions(goal)
 
+    def _close_goal(self, goal: SystemGoal, status: str):
+        """Move an active goal to a final status"""
+        goal.status = status
+        self._active_goal_ids.pop(goal.goal_id, None)
+
     def _is_goal_achieved(self, goal: SystemGoal) -> bool:
         """Check if a goal has been achieved"""
         # Simplified goal checking - would need specific metrics for each goal
@@ -728,25 +867,16 @@ class AutonomousOperations:
         # Check for sudden changes in metrics
         # This is a simplified anomaly detection
 
-        cpu_percent = system_health.get("cpu_percent", 0)
-        if cpu_percent > 95:
-            anomalies.append({
-                "type": "resource_spike",
-                "resource": "cpu",
-                "value": cpu_percent,
-                "threshold": 95,
-                "severity": "critical"
-            })
-
-        memory_percent = system_health.get("memory_percent", 0)
-        if memory_percent > 95:
-            anomalies.append({
-                "type": "resource_spike",
-                "resource": "memory",
-                "value": memory_percent,
-                "threshold": 95,
-                "severity": "critical"
-            })
+        for metric, resource in SPIKE_SPECS:
+            value = system_health.get(metric, 0)
+            if value > SPIKE_THRESHOLD:
+                anomalies.append({
+                    "type": "resource_spike",
+                    "resource": resource,
+                    "value": value,
+                    "threshold": SPIKE_THRESHOLD,
+                    "severity": "critical"
+                })
 
         return anomalies
 
@@ -763,7 +893,7 @@ class AutonomousOperations:
 
         if anomaly_type == "resource_spike":
             resource = anomaly["resource"]
-            print(f"🚨 Critical {resource} spike detected: {anomaly['value']}%")
+            logger.warning("Critical %s spike detected: %s%%", resource, anomaly["value"])
 
             # Trigger emergency optimization
             decision = self._generate_resource_decision(resource, "critical")
@@ -779,13 +909,13 @@ class AutonomousOperations:
         )
 
         return {
-            "operation_mode": self.operation_mode.value,
+            "operation_mode": self._operation_mode_value,
             "running": self.running,
             "decisions_made": total_decisions,
             "decisions_executed": self.performance_metrics["decisions_executed"],
             "success_rate": round(success_rate, 1),
             "average_confidence": round(self.performance_metrics["average_confidence"], 3),
-            "active_goals": len([g for g in self.system_goals.values() if g.status == "active"]),
+            "active_goals": len(self._active_goal_ids),
             "system_uptime": round(self.performance_metrics["system_uptime"], 1)
         }
 
@@ -799,16 +929,16 @@ class AutonomousOperations:
         Returns:
             List of recent decisions
         """
-        recent_decisions = self.decisions[-limit:]
+        recent_decisions = itertools.islice(self.decisions, max(0, len(self.decisions) - limit), None)
 
         return [
             {
                 "decision_id": d.decision_id,
-                "type": d.decision_type.value,
+                "type": d.type_value,
                 "description": d.description,
                 "confidence": round(d.confidence, 3),
                 "executed": d.executed,
-                "timestamp": d.timestamp.isoformat(),
+                "timestamp": d.iso_timestamp,
                 "result": d.result
             }
             for d in recent_decisions
@@ -836,38 +966,36 @@ class AutonomousOperations:
         Args:
             filepath: Path to export file
         """
-        export_data = {
-            "timestamp": datetime.now().isoformat(),
-            "operation_mode": self.operation_mode.value,
-            "performance_metrics": self.performance_metrics,
-            "decisions": [
-                {
-                    "decision_id": d.decision_id,
-                    "type": d.decision_type.value,
-                    "description": d.description,
-                    "confidence": d.confidence,
-                    "executed": d.executed,
-                    "timestamp": d.timestamp.isoformat(),
-                    "result": d.result
-                }
-                for d in self.decisions
-            ]
-        }
-
         try:
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
-            print(f"💾 Decision history exported to {filepath}")
+            # Stream decisions one at a time; the 1 MiB buffer coalesces the small writes
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                f.write(b'{\n  "timestamp": ' + _json_bytes(datetime.now()) +
+                        b',\n  "operation_mode": ' + _json_bytes(self._operation_mode_value) +
+                        b',\n  "performance_metrics": ' + _json_bytes(self.performance_metrics) +
+                        b',\n  "decisions": [\n')
+                for i, d in enumerate(self.decisions):
+                    f.write((b',\n    ' if i else b'    ') + _json_bytes({
+                        "decision_id": d.decision_id,
+                        "type": d.type_value,
+                        "description": d.description,
+                        "confidence": d.confidence,
+                        "executed": d.executed,
+                        "timestamp": d.iso_timestamp,
+                        "result": d.result
+                    }))
+                f.write(b'\n  ]\n}\n')
+            logger.info("Decision history exported to %s", filepath)
         except Exception as e:
-            print(f"❌ Failed to export decision history: {e}")
+            logger.error("Failed to export decision history: %s", e)
 
     def get_system_health(self) -> Dict[str, Any]:
         """Get autonomous operations system health"""
         return {
-            "operation_mode": self.operation_mode.value,
+            "operation_mode": self._operation_mode_value,
             "running": self.running,
             "active_tasks": len(self.autonomous_tasks),
             "decisions_count": len(self.decisions),
+            "decision_type_counts": dict(self._decision_type_counts),
             "goals_count": len(self.system_goals),
             "performance_metrics": self.performance_metrics
         }
\ No newline at end of file
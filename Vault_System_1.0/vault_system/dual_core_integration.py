@@ -10,12 +10,22 @@ to operate with hemispheric synchronization similar to human brain function.
 import asyncio
 import threading
 import time
-from typing import Dict, Any, List, Optional, Callable, Tuple
+import types
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Callable, Tuple, Mapping
 from datetime import datetime
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 from vault_core.ISS_bridge import ISSConnector
 
+# JIT compilation for batch task routing (optional import)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 class SynchronizationMode(Enum):
     """Modes for hemispheric synchronization"""
@@ -32,7 +42,69 @@ class Hemisphere(Enum):
     RIGHT = "right"
 
 
-@dataclass
+# Enum string values bound once, avoiding .value lookups on hot paths
+_MODE_STRS = {m: m.value for m in SynchronizationMode}
+_HEMISPHERE_STRS = {h: h.value for h in Hemisphere}
+
+
+# Wall-clock anchor for converting monotonic stamps at serialization time
+_WALL_REF = time.time()
+_MONOTONIC_REF_NS = time.monotonic_ns()
+
+
+def _monotonic_to_datetime(monotonic_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() stamp to a wall-clock datetime"""
+    return datetime.fromtimestamp(_WALL_REF + (monotonic_ns - _MONOTONIC_REF_NS) / 1e9)
+
+
+# Collaboration routes: task type -> route code, route code -> (processing_type, result, confidence)
+ROUTE_LEFT_DOMINANT, ROUTE_RIGHT_DOMINANT, ROUTE_BALANCED = 0, 1, 2
+_TASK_ROUTES = {
+    "analysis": ROUTE_LEFT_DOMINANT,
+    "logic": ROUTE_LEFT_DOMINANT,
+    "calculation": ROUTE_LEFT_DOMINANT,
+    "creativity": ROUTE_RIGHT_DOMINANT,
+    "intuition": ROUTE_RIGHT_DOMINANT,
+    "pattern_recognition": ROUTE_RIGHT_DOMINANT
+}
+_ROUTE_OUTCOMES = (
+    ("left_dominant", "processed_analytically"),
+    ("right_dominant", "processed_creatively"),
+    ("balanced_collaboration", "processed_collaboratively")
+)
+_ROUTE_CONFIDENCE = np.array([0.85, 0.78, 0.92])
+
+
+def _route_confidences(codes, confidence_table):
+    """Confidence for each route code"""
+    confidences = np.empty(codes.shape[0], dtype=np.float64)
+    for i in range(codes.shape[0]):
+        confidences[i] = confidence_table[codes[i]]
+    return confidences
+
+
+if NUMBA_AVAILABLE:
+    _route_confidences = njit(cache=True)(_route_confidences)
+else:
+    def _route_confidences(codes, confidence_table):
+        """Confidence for each route code"""
+        return confidence_table[codes]
+
+
+def _resolve_health_probe(instance: Any) -> Optional[Callable[[], bool]]:
+    """Bind the health probe an instance exposes, if any"""
+    health_check = getattr(instance, 'health_check', None)
+    if health_check is not None:
+        return health_check
+
+    get_system_health = getattr(instance, 'get_system_health', None)
+    if get_system_health is not None:
+        return lambda: get_system_health().get('overall_health') in ['good', 'excellent']
+
+    return None
+
+
+@dataclass(slots=True)
 class HemisphereMapping:
     """
     Mapping between left and right hemisphere instances.
@@ -41,13 +113,62 @@ class HemisphereMapping:
     left_instance: Any
     right_instance: Any
     sync_mode: SynchronizationMode
-    last_sync: Optional[datetime] = None
+    last_sync: Optional[int] = None  # time.monotonic_ns()
     sync_interval: int = 30  # seconds
-    health_status: Optional[Dict[str, bool]] = None
+    health_status: Optional[Dict[Hemisphere, bool]] = None
+
+    # Capabilities probed once at registration
+    left_health_fn: Optional[Callable] = field(default=None, init=False, repr=False)
+    right_health_fn: Optional[Callable] = field(default=None, init=False, repr=False)
+    left_vault_stats_fn: Optional[Callable] = field(default=None, init=False, repr=False)
+    right_vault_stats_fn: Optional[Callable] = field(default=None, init=False, repr=False)
+
+    # Mode handler selected at registration
+    sync_handler: Optional[Callable] = field(default=None, init=False, repr=False)
+
+    # Static part of get_hemisphere_status(), built once
+    status_template: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    # Set by producers to pull the next sync forward
+    dirty_event: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
 
     def __post_init__(self):
         if self.health_status is None:
-            self.health_status = {Hemisphere.LEFT.value: True, Hemisphere.RIGHT.value: True}
+            self.health_status = {Hemisphere.LEFT: True, Hemisphere.RIGHT: True}
+
+        self.left_health_fn = _resolve_health_probe(self.left_instance)
+        self.right_health_fn = _resolve_health_probe(self.right_instance)
+        self.left_vault_stats_fn = getattr(self.left_instance, 'get_vault_stats', None)
+        self.right_vault_stats_fn = getattr(self.right_instance, 'get_vault_stats', None)
+
+        self.status_template = {
+            "component_name": self.component_name,
+            "sync_mode": _MODE_STRS[self.sync_mode],
+            "last_sync": None,
+            "sync_interval": self.sync_interval
+        }
+
+
+class SyncModeError(Exception):
+    """Raised when a synchronization mode handler fails for a component"""
+
+    def __init__(self, sync_mode: SynchronizationMode, component_name: str, cause: Exception):
+        super().__init__(f"{sync_mode.value} sync failed for {component_name}: {cause}")
+        self.sync_mode = sync_mode
+        self.component_name = component_name
+        self.cause = cause
+
+
+@dataclass(slots=True)
+class SyncPerformance:
+    """
+    Running synchronization counters.
+    """
+    total_syncs: int = 0
+    successful_syncs: int = 0
+    failed_syncs: int = 0
+    timed_syncs: int = 0  # syncs that completed and were folded into avg_sync_time
+    avg_sync_time: float = 0.0
 
 
 class SynchronizationEvent:
@@ -55,6 +176,8 @@ class SynchronizationEvent:
     Represents a synchronization event between hemispheres.
     """
 
+    __slots__ = ("component_name", "event_type", "source_hemisphere", "data", "_created_ns", "event_id")
+
     def __init__(self, component_name: str, event_type: str,
                  source_hemisphere: Hemisphere, data: Dict[str, Any]):
         """
@@ -70,8 +193,13 @@ class SynchronizationEvent:
         self.event_type = event_type
         self.source_hemisphere = source_hemisphere
         self.data = data
-        self.timestamp = datetime.now()
-        self.event_id = f"sync_{int(time.time()*1000000)}"
+        self._created_ns = time.monotonic_ns()
+        self.event_id = f"sync_{self._created_ns}"
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the event was created"""
+        return _monotonic_to_datetime(self._created_ns)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary"""
@@ -79,7 +207,7 @@ class SynchronizationEvent:
             "event_id": self.event_id,
             "component_name": self.component_name,
             "event_type": self.event_type,
-            "source_hemisphere": self.source_hemisphere.value,
+            "source_hemisphere": _HEMISPHERE_STRS[self.source_hemisphere],
             "data": self.data,
             "timestamp": self.timestamp.isoformat()
         }
@@ -107,27 +235,45 @@ class DualCoreIntegration:
         # Hemisphere mappings
         self.hemisphere_mappings: Dict[str, HemisphereMapping] = {}
 
-        # Synchronization state
-        self.sync_events: List[SynchronizationEvent] = []
-        self.max_events = 1000
+        # Synchronization state (fixed ring, capacity rounded up to a power of two)
+        self.max_events = 1 << (1000 - 1).bit_length()
+        self.sync_events: List[Optional[SynchronizationEvent]] = [None] * self.max_events
+        self._sync_write_pos = 0
+        self._sync_count = 0
+
+        # Serialized events per component, for filtered queries
+        self._events_by_component: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.max_events))
 
         # Synchronization tasks
         self.sync_tasks: Dict[str, asyncio.Task] = {}
         self.running = False
 
-        # Performance metrics
-        self.sync_performance = {
-            "total_syncs": 0,
-            "successful_syncs": 0,
-            "failed_syncs": 0,
-            "avg_sync_time": 0.0
+        # Bound on concurrent syncs when synchronizing every component at once
+        self.max_concurrent_syncs = 8
+        self._sync_semaphore = asyncio.Semaphore(self.max_concurrent_syncs)
+
+        # Sync handlers by mode; only redundant mode does work beyond health checks
+        self._sync_dispatch: Dict[SynchronizationMode, Callable] = {
+            SynchronizationMode.REDUNDANT: self._sync_redundant,
+            SynchronizationMode.MIRROR: self._sync_health_only,
+            SynchronizationMode.SPECIALIZED: self._sync_health_only,
+            SynchronizationMode.COMPETITIVE: self._sync_health_only,
+            SynchronizationMode.COLLABORATIVE: self._sync_health_only
         }
 
+        # Performance metrics
+        self.sync_performance = SyncPerformance()
+
         # Hemisphere specialization
         self.hemisphere_specializations = {
             Hemisphere.LEFT: ["logical", "analytical", "sequential"],
             Hemisphere.RIGHT: ["intuitive", "creative", "parallel"]
         }
+        # Read-only serialized form, built once
+        self._serialized_specializations = types.MappingProxyType({
+            _HEMISPHERE_STRS[hemisphere]: tuple(specializations)
+            for hemisphere, specializations in self.hemisphere_specializations.items()
+        })
 
         print("🧠 Dual-Core Integration initialized")
 
@@ -151,6 +297,7 @@ class DualCoreIntegration:
             sync_mode=sync_mode,
             sync_interval=sync_interval
         )
+        mapping.sync_handler = self._sync_dispatch.get(sync_mode)
 
         self.hemisphere_mappings[component_name] = mapping
 
@@ -174,8 +321,20 @@ class DualCoreIntegration:
                 del self.sync_tasks[component_name]
 
             del self.hemisphere_mappings[component_name]
+            self._events_by_component.pop(component_name, None)
             print(f"✅ Unregistered hemisphere mapping for {component_name}")
 
+    def mark_dirty(self, component_name: str):
+        """
+        Signal that a component's state changed so its next sync runs immediately.
+
+        Args:
+            component_name: Name of the component
+        """
+        mapping = self.hemisphere_mappings.get(component_name)
+        if mapping:
+            mapping.dirty_event.set()
+
     def start_synchronization(self):
         """Start all synchronization tasks"""
         if self.running:
@@ -188,15 +347,30 @@ class DualCoreIntegration:
 
         print("🔄 Started dual-core synchronization")
 
-    def stop_synchronization(self):
-        """Stop all synchronization tasks"""
+    def stop_synchronization(self) -> List[asyncio.Task]:
+        """
+        Stop all synchronization tasks.
+
+        Returns:
+            The cancelled tasks, for callers with a running loop to await
+        """
         self.running = False
 
-        for task in self.sync_tasks.values():
+        tasks = list(self.sync_tasks.values())
+        for task in tasks:
             task.cancel()
-
         self.sync_tasks.clear()
+
         print("🛑 Stopped dual-core synchronization")
+        return tasks
+
+    async def stop_synchronization_async(self):
+        """Stop all synchronization tasks and wait for them to finish"""
+        tasks = self.stop_synchronization()
+
+        # Tasks left over from a loop that is no longer running cannot be awaited here
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[t for t in tasks if t.get_loop() is loop], return_exceptions=True)
 
     def _start_sync_task(self, component_name: str):
         """Start synchronization task for a component"""
@@ -206,9 +380,19 @@ class DualCoreIntegration:
         async def sync_loop():
             while self.running and component_name in self.hemisphere_mappings:
                 try:
-                    await self._perform_synchronization(component_name)
+                    try:
+                        await self._perform_synchronization(component_name)
+                    except SyncModeError:
+                        pass  # Already recorded; retry on the normal schedule
                     mapping = self.hemisphere_mappings[component_name]
-                    await asyncio.sleep(mapping.sync_interval)
+
+                    # Sleep until a state change is signalled, or the keepalive interval;
+                    # any burst of signals while waiting coalesces into one sync
+                    try:
+                        await asyncio.wait_for(mapping.dirty_event.wait(), timeout=mapping.sync_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    mapping.dirty_event.clear()
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
@@ -219,41 +403,41 @@ class DualCoreIntegration:
         self.sync_tasks[component_name] = task
 
     async def _perform_synchronization(self, component_name: str):
-        """Perform synchronization for a component"""
+        """
+        Perform synchronization for a component.
+
+        Raises:
+            SyncModeError: If the mode handler raised; the failure is recorded first
+        """
         if component_name not in self.hemisphere_mappings:
             return
 
         mapping = self.hemisphere_mappings[component_name]
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            if mapping.sync_mode == SynchronizationMode.REDUNDANT:
-                success = await self._sync_redundant(mapping)
-            elif mapping.sync_mode == SynchronizationMode.MIRROR:
-                success = await self._sync_mirror(mapping)
-            elif mapping.sync_mode == SynchronizationMode.SPECIALIZED:
-                success = await self._sync_specialized(mapping)
-            elif mapping.sync_mode == SynchronizationMode.COMPETITIVE:
-                success = await self._sync_competitive(mapping)
-            elif mapping.sync_mode == SynchronizationMode.COLLABORATIVE:
-                success = await self._sync_collaborative(mapping)
-            else:
+            if mapping.sync_handler is None:
                 print(f"⚠️  Unknown sync mode for {component_name}: {mapping.sync_mode}")
                 return
 
-            duration = time.time() - start_time
-            mapping.last_sync = datetime.now()
+            success = await mapping.sync_handler(mapping)
+
+            duration = time.monotonic() - start_time
+            mapping.last_sync = time.monotonic_ns()
 
             # Update performance metrics
-            self.sync_performance["total_syncs"] += 1
+            perf = self.sync_performance
+            perf.total_syncs += 1
             if success:
-                self.sync_performance["successful_syncs"] += 1
+                perf.successful_syncs += 1
             else:
-                self.sync_performance["failed_syncs"] += 1
+                perf.failed_syncs += 1
 
-            # Update average sync time
-            total_time = self.sync_performance["avg_sync_time"] * (self.sync_performance["total_syncs"] - 1) + duration
-            self.sync_performance["avg_sync_time"] = total_time / self.sync_performance["total_syncs"]
+            # Incremental mean of sync time over completed syncs; handler
+            # exceptions count towards total_syncs but carry no duration
+            perf.timed_syncs += 1
+            avg = perf.avg_sync_time
+            perf.avg_sync_time = avg + (duration - avg) / perf.timed_syncs
 
             # Record sync event
             event = SynchronizationEvent(
@@ -263,7 +447,7 @@ class DualCoreIntegration:
                 data={
                     "success": success,
                     "duration": duration,
-                    "sync_mode": mapping.sync_mode.value
+                    "sync_mode": _MODE_STRS[mapping.sync_mode]
                 }
             )
             self._record_sync_event(event)
@@ -271,138 +455,74 @@ class DualCoreIntegration:
         except Exception as e:
             print(f"❌ Synchronization failed for {component_name}: {e}")
 
+            perf = self.sync_performance
+            perf.total_syncs += 1
+            perf.failed_syncs += 1
+
             # Record failure event
             event = SynchronizationEvent(
                 component_name=component_name,
                 event_type="sync_error",
                 source_hemisphere=Hemisphere.LEFT,
-                data={"error": str(e), "sync_mode": mapping.sync_mode.value}
+                data={"error": str(e), "sync_mode": _MODE_STRS[mapping.sync_mode]}
             )
             self._record_sync_event(event)
 
+            raise SyncModeError(mapping.sync_mode, component_name, e) from e
+
     async def _sync_redundant(self, mapping: HemisphereMapping) -> bool:
         """Perform redundant synchronization (identical state)"""
-        try:
-            # In redundant mode, ensure both hemispheres have identical state
-            # This is a simplified implementation
-
-            # Check if both instances are healthy
-            left_healthy = await self._check_hemisphere_health(mapping.left_instance, Hemisphere.LEFT)
-            right_healthy = await self._check_hemisphere_health(mapping.right_instance, Hemisphere.RIGHT)
-
-            if not left_healthy or not right_healthy:
-                return False
-
-            # For vault components, ensure data consistency
-            if hasattr(mapping.left_instance, 'get_vault_stats'):
-                left_stats = mapping.left_instance.get_vault_stats()
-                right_stats = mapping.right_instance.get_vault_stats()
-
-                # Simple consistency check
-                if left_stats.get('total_entries') != right_stats.get('total_entries'):
-                    # Trigger reconciliation
-                    await self._reconcile_vault_data(mapping)
-                    return True
-
-            return True
-
-        except Exception as e:
-            print(f"❌ Redundant sync failed: {e}")
-            return False
-
-    async def _sync_mirror(self, mapping: HemisphereMapping) -> bool:
-        """Perform mirror synchronization (reflect operations)"""
-        try:
-            # In mirror mode, operations on one hemisphere are reflected to the other
-
-            # Check health
-            left_healthy = await self._check_hemisphere_health(mapping.left_instance, Hemisphere.LEFT)
-            right_healthy = await self._check_hemisphere_health(mapping.right_instance, Hemisphere.RIGHT)
-
-            if not left_healthy or not right_healthy:
-                return False
-
-            # For mirror sync, we could implement operation mirroring
-            # This is a simplified version that just ensures both are operational
-
-            return True
-
-        except Exception as e:
-            print(f"❌ Mirror sync failed: {e}")
-            return False
-
-    async def _sync_specialized(self, mapping: HemisphereMapping) -> bool:
-        """Perform specialized synchronization (different functions)"""
-        try:
-            # In specialized mode, hemispheres perform different functions
-            # Left: logical/analytical, Right: intuitive/creative
-
-            left_healthy = await self._check_hemisphere_health(mapping.left_instance, Hemisphere.LEFT)
-            right_healthy = await self._check_hemisphere_health(mapping.right_instance, Hemisphere.RIGHT)
+        # In redundant mode, ensure both hemispheres have identical state
+        # This is a simplified implementation
 
-            if not left_healthy or not right_healthy:
-                return False
-
-            # Specialized sync could involve cross-hemisphere collaboration
-            # For now, just ensure both are healthy
-
-            return True
-
-        except Exception as e:
-            print(f"❌ Specialized sync failed: {e}")
-            return False
-
-    async def _sync_competitive(self, mapping: HemisphereMapping) -> bool:
-        """Perform competitive synchronization (optimal solutions)"""
-        try:
-            # In competitive mode, hemispheres compete for best solutions
+        # Check if both instances are healthy
+        left_healthy, right_healthy = await self._check_both(mapping)
 
-            left_healthy = await self._check_hemisphere_health(mapping.left_instance, Hemisphere.LEFT)
-            right_healthy = await self._check_hemisphere_health(mapping.right_instance, Hemisphere.RIGHT)
-
-            if not left_healthy or not right_healthy:
-                return False
-
-            # Competitive sync could involve comparing results
-            # For now, just ensure both are operational
-
-            return True
-
-        except Exception as e:
-            print(f"❌ Competitive sync failed: {e}")
+        if not left_healthy or not right_healthy:
             return False
 
-    async def _sync_collaborative(self, mapping: HemisphereMapping) -> bool:
-        """Perform collaborative synchronization (complex tasks)"""
-        try:
-            # In collaborative mode, hemispheres work together on complex tasks
-
-            left_healthy = await self._check_hemisphere_health(mapping.left_instance, Hemisphere.LEFT)
-            right_healthy = await self._check_hemisphere_health(mapping.right_instance, Hemisphere.RIGHT)
+        # For vault components, ensure data consistency
+        if mapping.left_vault_stats_fn is not None:
+            left_stats = mapping.left_vault_stats_fn()
+            right_stats = mapping.right_vault_stats_fn()
 
-            if not left_healthy or not right_healthy:
-                return False
+            # Simple consistency check
+            if left_stats.get('total_entries') != right_stats.get('total_entries'):
+                # Trigger reconciliation
+                await self._reconcile_vault_data(mapping)
+                return True
 
-            # Collaborative sync could involve distributed processing
-            # For now, just ensure both are healthy
+        return True
 
-            return True
+    async def _sync_health_only(self, mapping: HemisphereMapping) -> bool:
+        """
+        Perform mirror, specialized, competitive or collaborative synchronization.
 
-        except Exception as e:
-            print(f"❌ Collaborative sync failed: {e}")
-            return False
+        These modes would reflect operations, split functions, compare results or
+        distribute work between hemispheres; for now each only ensures both are healthy.
+        """
+        left_healthy, right_healthy = await self._check_both(mapping)
+        return left_healthy and right_healthy
+
+    async def _check_both(self, mapping: HemisphereMapping) -> Tuple[bool, bool]:
+        """Check health of both hemispheres concurrently"""
+        left, right = await asyncio.gather(
+            self._check_hemisphere_health(mapping.left_health_fn, Hemisphere.LEFT),
+            self._check_hemisphere_health(mapping.right_health_fn, Hemisphere.RIGHT),
+            return_exceptions=True
+        )
+        return (not isinstance(left, BaseException) and bool(left),
+                not isinstance(right, BaseException) and bool(right))
 
-    async def _check_hemisphere_health(self, instance: Any, hemisphere: Hemisphere) -> bool:
-        """Check health of a hemisphere instance"""
+    async def _check_hemisphere_health(self, health_fn: Optional[Callable[[], bool]],
+                                       hemisphere: Hemisphere) -> bool:
+        """Check health of a hemisphere through its pre-bound probe"""
         try:
-            if hasattr(instance, 'health_check'):
-                return instance.health_check()
-            elif hasattr(instance, 'get_system_health'):
-                health = instance.get_system_health()
-                return health.get('overall_health') in ['good', 'excellent']
-            else:
+            if health_fn is None:
                 # Basic health check - assume healthy if no explicit check
                 return True
+            # Component probes are synchronous; run them off the event loop
+            return await asyncio.to_thread(health_fn)
         except Exception:
             return False
 
@@ -417,11 +537,17 @@ class DualCoreIntegration:
 
     def _record_sync_event(self, event: SynchronizationEvent):
         """Record a synchronization event"""
-        self.sync_events.append(event)
-
-        # Maintain event limit
-        if len(self.sync_events) > self.max_events:
-            self.sync_events = self.sync_events[-self.max_events:]
+        self.sync_events[self._sync_write_pos & (self.max_events - 1)] = event
+        self._sync_write_pos += 1
+        self._sync_count += 1
+        self._events_by_component[event.component_name].append(event.to_dict())
+
+    def _ordered_sync_events(self) -> List[SynchronizationEvent]:
+        """Return recorded events oldest-first"""
+        if self._sync_count < self.max_events:
+            return self.sync_events[:self._sync_count]
+        pos = self._sync_write_pos & (self.max_events - 1)
+        return self.sync_events[pos:] + self.sync_events[:pos]
 
     async def synchronize_hemispheres(self, component_name: Optional[str] = None) -> bool:
         """
@@ -437,16 +563,21 @@ class DualCoreIntegration:
             if component_name not in self.hemisphere_mappings:
                 return False
 
-            await self._perform_synchronization(component_name)
+            try:
+                await self._perform_synchronization(component_name)
+            except SyncModeError:
+                return False
             return True
         else:
-            # Sync all components
-            tasks = [
-                self._perform_synchronization(name)
-                for name in self.hemisphere_mappings.keys()
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Sync all components, snapshotting names against concurrent (un)registration
+            async def _bounded(name: str):
+                async with self._sync_semaphore:
+                    return await self._perform_synchronization(name)
+
+            results = await asyncio.gather(
+                *[_bounded(name) for name in tuple(self.hemisphere_mappings)],
+                return_exceptions=True
+            )
 
             # Check if all succeeded
             return all(not isinstance(r, Exception) for r in results)
@@ -467,28 +598,27 @@ class DualCoreIntegration:
 
         # Ensure health_status is always a dict
         if mapping.health_status is None:
-            mapping.health_status = {Hemisphere.LEFT.value: True, Hemisphere.RIGHT.value: True}
+            mapping.health_status = {Hemisphere.LEFT: True, Hemisphere.RIGHT: True}
 
-        return {
-            "component_name": component_name,
-            "sync_mode": mapping.sync_mode.value,
-            "last_sync": mapping.last_sync.isoformat() if mapping.last_sync else None,
-            "sync_interval": mapping.sync_interval,
-            "left_healthy": mapping.health_status[Hemisphere.LEFT.value],
-            "right_healthy": mapping.health_status[Hemisphere.RIGHT.value],
-            "both_healthy": all(mapping.health_status.values())
-        }
+        status = mapping.status_template.copy()
+        if mapping.last_sync:
+            status["last_sync"] = _monotonic_to_datetime(mapping.last_sync).isoformat()
+        status["left_healthy"] = left_healthy = mapping.health_status[Hemisphere.LEFT]
+        status["right_healthy"] = right_healthy = mapping.health_status[Hemisphere.RIGHT]
+        status["both_healthy"] = bool(left_healthy and right_healthy)
+        return status
 
     def get_sync_performance(self) -> Dict[str, Any]:
         """Get synchronization performance metrics"""
-        total_syncs = self.sync_performance["total_syncs"]
+        perf = self.sync_performance
+        total_syncs = perf.total_syncs
 
         return {
             "total_syncs": total_syncs,
-            "successful_syncs": self.sync_performance["successful_syncs"],
-            "failed_syncs": self.sync_performance["failed_syncs"],
-            "success_rate": round(self.sync_performance["successful_syncs"] / total_syncs * 100, 1) if total_syncs > 0 else 0,
-            "average_sync_time": round(self.sync_performance["avg_sync_time"], 3),
+            "successful_syncs": perf.successful_syncs,
+            "failed_syncs": perf.failed_syncs,
+            "success_rate": round(perf.successful_syncs / total_syncs * 100, 1) if total_syncs > 0 else 0,
+            "average_sync_time": round(perf.avg_sync_time, 3),
             "active_mappings": len(self.hemisphere_mappings),
             "running": self.running
         }
@@ -504,12 +634,11 @@ class DualCoreIntegration:
         Returns:
             List of synchronization events
         """
-        events = self.sync_events
-
         if component_name:
-            events = [e for e in events if e.component_name == component_name]
+            events = self._events_by_component.get(component_name)
+            return list(events)[-limit:] if events else []
 
-        return [event.to_dict() for event in events[-limit:]]
+        return [event.to_dict() for event in self._ordered_sync_events()[-limit:]]
 
     def hemispheric_collaboration(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -539,6 +668,36 @@ class DualCoreIntegration:
 
         return result
 
+    def hemispheric_collaboration_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Route a stream of tasks in one pass.
+
+        Produces the same results as calling hemispheric_collaboration() on each
+        task with the built-in processors, with routing done on an array of codes.
+
+        Args:
+            tasks: Task descriptions and parameters
+
+        Returns:
+            Collaboration results, in task order
+        """
+        codes = np.fromiter(
+            (_TASK_ROUTES.get(task.get("type", "unknown"), ROUTE_BALANCED) for task in tasks),
+            dtype=np.int8, count=len(tasks)
+        )
+        confidences = _route_confidences(codes, _ROUTE_CONFIDENCE)
+
+        results = []
+        for task, code, confidence in zip(tasks, codes.tolist(), confidences.tolist()):
+            processing_type, result = _ROUTE_OUTCOMES[code]
+            results.append({
+                "task_id": task.get("id", "unknown"),
+                "processing_type": processing_type,
+                "result": result,
+                "confidence": confidence
+            })
+        return results
+
     def _process_left_dominant_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process left-dominant task"""
         # Simplified implementation
@@ -569,12 +728,9 @@ class DualCoreIntegration:
             "confidence": 0.92
         }
 
-    def get_hemisphere_specializations(self) -> Dict[str, List[str]]:
-        """Get hemisphere specialization information"""
-        return {
-            hemisphere.value: specializations
-            for hemisphere, specializations in self.hemisphere_specializations.items()
-        }
+    def get_hemisphere_specializations(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get hemisphere specialization information (read-only)"""
+        return self._serialized_specializations
 
     def update_hemisphere_health(self, component_name: str, hemisphere: Hemisphere, healthy: bool):
         """
@@ -588,19 +744,34 @@ class DualCoreIntegration:
         mapping = self.hemisphere_mappings.get(component_name)
         if mapping:
             if mapping.health_status is None:
-                mapping.health_status = {Hemisphere.LEFT.value: True, Hemisphere.RIGHT.value: True}
-            mapping.health_status[hemisphere.value] = healthy
+                mapping.health_status = {Hemisphere.LEFT: True, Hemisphere.RIGHT: True}
+            mapping.health_status[hemisphere] = healthy
 
-    def graceful_shutdown(self):
+    async def graceful_shutdown(self):
         """Perform graceful shutdown of dual-core integration"""
         print("🧠 Shutting down dual-core integration")
 
-        self.stop_synchronization()
+        await self.stop_synchronization_async()
 
-        # Final sync attempt
+        # Final sync attempt, on the loop that owned the sync tasks
         try:
-            asyncio.run(self.synchronize_hemispheres())
+            await self.synchronize_hemispheres()
         except Exception as e:
             print(f"⚠️  Final sync failed: {e}")
 
-        print("✅ Dual-core integration shutdown complete")
\ No newline at end of file
+        print("✅ Dual-core integration shutdown complete")
+
+    def graceful_shutdown_sync(self) -> Optional[asyncio.Task]:
+        """
+        Run graceful_shutdown() from synchronous code.
+
+        Returns:
+            The scheduled shutdown task if called while an event loop is running,
+            otherwise None once shutdown has completed
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.graceful_shutdown())
+            return None
+        return loop.create_task(self.graceful_shutdown())
@@ -0,0 +1,45 @@
+# event_loop_policy.py
+
+"""
+Event Loop Policy - Optional uvloop Opt-In for Entry Points
+
+This module lets vault system entry points switch asyncio to the libuv-backed
+uvloop event loop when it is installed, without pulling in any other component.
+"""
+
+import asyncio
+
+# libuv-backed event loop (optional import)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+_uvloop_policy_installed = False
+
+
+def install_uvloop_policy() -> bool:
+    """
+    Make uvloop the event loop policy for loops created from now on.
+
+    This changes the process-wide policy, so it is an explicit opt-in for entry
+    points. A loop that is already running keeps its implementation, so call
+    it before the host starts its loop (asyncio.run).
+
+    Returns:
+        True if the uvloop policy is installed
+    """
+    global _uvloop_policy_installed
+    if _uvloop_policy_installed or not UVLOOP_AVAILABLE:
+        return _uvloop_policy_installed
+
+    try:
+        asyncio.get_running_loop()
+        return False
+    except RuntimeError:
+        pass
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _uvloop_policy_installed = True
+    return True
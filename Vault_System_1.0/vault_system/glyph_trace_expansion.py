@@ -7,12 +7,14 @@ This module provides comprehensive reasoning path tracking through glyph traces,
 enabling auditability and analysis of decision-making processes in the vault system.
 """
 
+import itertools
 import json
 import time
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Deque
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from enum import Enum
+import numpy as np
 from vault_core.glyph_generator import GlyphGenerator, GlyphType
 
 
@@ -33,6 +35,12 @@ class TraceNode:
     A node in the reasoning trace graph.
     """
 
+    # Unique, monotonic ids; seeded from the clock so ids stay distinct across restarts
+    _counter = itertools.count(time.time_ns() // 1000)
+
+    # Released nodes available for reuse by acquire()
+    _pool: Deque['TraceNode'] = deque(maxlen=4096)
+
     def __init__(self, step: ReasoningStep, component: str,
                  data: Dict[str, Any], glyph_id: Optional[str] = None):
         """
@@ -45,11 +53,13 @@ class TraceNode:
             glyph_id: Associated glyph identifier
         """
         self.step = step
+        self.step_value = step.value
         self.component = component
         self.data = data
         self.glyph_id = glyph_id
-        self.timestamp = datetime.now()
-        self.node_id = f"node_{int(time.time()*1000000)}"
+        self.timestamp_ts = time.time()
+        self._iso_ts: Optional[str] = None  # timestamp.isoformat(), filled on first to_dict()
+        self.node_id = f"node_{next(TraceNode._counter)}"
 
         # Graph connections
         self.parents: List[str] = []
@@ -60,15 +70,52 @@ class TraceNode:
         self.processing_time = data.get("processing_time", 0.0)
         self.evidence_strength = data.get("evidence_strength", 0.0)
 
+    @classmethod
+    def acquire(cls, step: ReasoningStep, component: str,
+                data: Dict[str, Any], glyph_id: Optional[str] = None) -> 'TraceNode':
+        """
+        Create a trace node, reusing a released instance when one is pooled.
+
+        Args:
+            step: Reasoning step this node represents
+            component: Component that created this node
+            data: Data associated with this step
+            glyph_id: Associated glyph identifier
+
+        Returns:
+            Initialized trace node
+        """
+        if cls._pool:
+            node = cls._pool.pop()
+            node.__init__(step, component, data, glyph_id)
+            return node
+        return cls(step, component, data, glyph_id)
+
+    def release(self):
+        """Drop this node's references and return it to the pool"""
+        self.data = None
+        self.glyph_id = None
+        # Rebind rather than clear: to_dict() hands these lists out
+        self.parents = []
+        self.children = []
+        TraceNode._pool.append(self)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a datetime, built on demand"""
+        return datetime.fromtimestamp(self.timestamp_ts)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert node to dictionary"""
+        if self._iso_ts is None:
+            self._iso_ts = self.timestamp.isoformat()
         return {
             "node_id": self.node_id,
-            "step": self.step.value,
+            "step": self.step_value,
             "component": self.component,
             "data": self.data,
             "glyph_id": self.glyph_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso_ts,
             "parents": self.parents,
             "children": self.children,
             "confidence_score": self.confidence_score,
@@ -89,7 +136,8 @@ class TraceNode:
             glyph_id=glyph_id
         )
         node.node_id = data["node_id"]
-        node.timestamp = datetime.fromisoformat(data["timestamp"])
+        node.timestamp_ts = datetime.fromisoformat(data["timestamp"]).timestamp()
+        node._iso_ts = data["timestamp"]
         node.parents = data.get("parents", [])
         node.children = data.get("children", [])
         node.confidence_score = data.get("confidence_score", 0.5)
@@ -118,8 +166,9 @@ class ReasoningPath:
 
         # Path structure
         self.nodes: Dict[str, TraceNode] = {}
-        self.root_nodes: List[str] = []
-        self.leaf_nodes: List[str] = []
+        # Root and leaf ids as insertion-ordered sets (dict keys), maintained per insert
+        self.root_nodes: Dict[str, None] = {}
+        self.leaf_nodes: Dict[str, None] = {}
 
         # Path metadata
         self.total_processing_time = 0.0
@@ -128,8 +177,15 @@ class ReasoningPath:
         self.decision_outcome = None
         self.verdict_confidence = 0.0
 
+        # Running aggregates over nodes, maintained per insert
+        self._conf_sum = 0.0
+        self._ev_sum = 0.0
+        self._step_counts: Counter = Counter()
+
         # Analysis cache
-        self.analysis_cache: Dict[str, Any] = {}
+        self._analysis: Optional[Dict[str, Any]] = None
+        self._depth_cache: Dict[str, int] = {}  # node_id -> depth of the subtree below it
+        self._critical_path_cache: Optional[List[str]] = None
 
     def add_node(self, node: TraceNode, parent_ids: Optional[List[str]] = None):
         """
@@ -139,7 +195,10 @@ class ReasoningPath:
             node: Node to add
             parent_ids: IDs of parent nodes
         """
-        self.nodes[node.node_id] = node
+        self._track_node(node)
+        self._analysis = None
+        self._depth_cache.clear()
+        self._critical_path_cache = None
 
         # Set up parent-child relationships
         if parent_ids:
@@ -153,22 +212,31 @@ class ReasoningPath:
 
         # Update root and leaf nodes
         if not node.parents:
-            if node.node_id not in self.root_nodes:
-                self.root_nodes.append(node.node_id)
+            self.root_nodes[node.node_id] = None
         else:
             # Remove from roots if it was one
-            if node.node_id in self.root_nodes:
-                self.root_nodes.remove(node.node_id)
+            self.root_nodes.pop(node.node_id, None)
+
+        # Parents now have a child; the new node is a leaf
+        for parent_id in node.parents:
+            self.leaf_nodes.pop(parent_id, None)
+        if not node.children:
+            self.leaf_nodes[node.node_id] = None
+
+    def _track_node(self, node: TraceNode):
+        """Store a node and fold it into the running aggregates"""
+        previous = self.nodes.get(node.node_id)
+        if previous is not None:
+            self._conf_sum -= previous.confidence_score
+            self._ev_sum -= previous.evidence_strength
+            self._step_counts[previous.step_value] -= 1
+            if not self._step_counts[previous.step_value]:
+                del self._step_counts[previous.step_value]
 
-        # Update leaf nodes
-        self._update_leaf_nodes()
-
-    def _update_leaf_nodes(self):
-        """Update the list of leaf nodes"""
-        self.leaf_nodes = [
-            node_id for node_id in self.nodes.keys()
-            if not self.nodes[node_id].children
-        ]
+        self.nodes[node.node_id] = node
+        self._conf_sum += node.confidence_score
+        self._ev_sum += node.evidence_strength
+        self._step_counts[node.step_value] += 1
 
     def complete_path(self, decision_outcome: Any, verdict_confidence: float,
                      processing_time: float):
@@ -188,75 +256,110 @@ class ReasoningPath:
         # Calculate path statistics
         self._calculate_path_statistics()
 
+        # Paths are immutable once complete, so analyze them up front
+        self._analysis = self._build_analysis()
+
     def _calculate_path_statistics(self):
         """Calculate statistics for the reasoning path"""
         if not self.nodes:
             return
 
-        confidences = [node.confidence_score for node in self.nodes.values()]
-        evidence_strengths = [node.evidence_strength for node in self.nodes.values()]
-
-        self.average_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        self.evidence_strength = sum(evidence_strengths) / len(evidence_strengths) if evidence_strengths else 0.0
+        node_count = len(self.nodes)
+        self.average_confidence = self._conf_sum / node_count
+        self.evidence_strength = self._ev_sum / node_count
 
     def get_path_depth(self) -> int:
         """Get the maximum depth of the reasoning path"""
         if not self.nodes:
             return 0
 
-
-        def get_node_depth(node_id: str, visited: Optional[Set[str]] = None) -> int:
-            if visited is None:
-                visited = set()
-
-            if node_id in visited:
-                return 0  # Avoid cycles
-
-            visited.add(node_id)
-            node = self.nodes[node_id]
-
-            if not node.children:
-                return 1
-
-            return 1 + max(get_node_depth(child, visited.copy()) for child in node.children)
-
-        return max(get_node_depth(root) for root in self.root_nodes) if self.root_nodes else 0
+        nodes = self.nodes
+        depths = self._depth_cache
+
+        # Iterative post-order DFS; each node is resolved once and memoized.
+        # Nodes on the current DFS stack (gray) count as depth 0 to break cycles.
+        gray: Set[str] = set()
+        for root in self.root_nodes:
+            if root in depths:
+                continue
+            gray.add(root)
+            stack = [(root, iter(nodes[root].children))]
+            while stack:
+                node_id, children = stack[-1]
+                for child in children:
+                    if child not in depths and child not in gray:
+                        gray.add(child)
+                        stack.append((child, iter(nodes[child].children)))
+                        break
+                else:
+                    stack.pop()
+                    gray.discard(node_id)
+                    depths[node_id] = 1 + max((depths.get(child, 0) for child in nodes[node_id].children), default=0)
+
+        return max(depths[root] for root in self.root_nodes) if self.root_nodes else 0
 
     def get_critical_path(self) -> List[str]:
         """Get the critical path (longest chain of reasoning)"""
         if not self.nodes:
             return []
 
-        def find_longest_path(node_id: str, visited: Optional[Set[str]] = None) -> List[str]:
-            if visited is None:
-                visited = set()
-
-            if node_id in visited:
-                return []
+        if self._critical_path_cache is None:
+            self._critical_path_cache = self._compute_critical_path()
+        return list(self._critical_path_cache)
 
-            visited.add(node_id)
-            node = self.nodes[node_id]
+    def _compute_critical_path(self) -> List[str]:
+        """Longest root-to-leaf chain, via dynamic programming over a topological order"""
+        nodes = self.nodes
 
-            if not node.children:
-                return [node_id]
-
-            longest = []
+        # Kahn's algorithm; nodes caught in a cycle never reach indegree 0 and are skipped
+        indegree = dict.fromkeys(nodes, 0)
+        for node in nodes.values():
             for child in node.children:
-                path = find_longest_path(child, visited.copy())
-                if len(path) > len(longest):
-                    longest = path
-
-            return [node_id] + longest
-
-        critical_paths = [find_longest_path(root) for root in self.root_nodes]
-        return max(critical_paths, key=len) if critical_paths else []
+                indegree[child] += 1
+        ready = deque(node_id for node_id, degree in indegree.items() if degree == 0)
+        order = []
+        while ready:
+            node_id = ready.popleft()
+            order.append(node_id)
+            for child in nodes[node_id].children:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+
+        # Longest suffix from each node, as a length plus the child it continues through;
+        # ties go to the first child, as in a depth-first scan
+        length: Dict[str, int] = {}
+        successor: Dict[str, Optional[str]] = {}
+        for node_id in reversed(order):
+            best_child, best_length = None, 0
+            for child in nodes[node_id].children:
+                child_length = length.get(child, 0)
+                if child_length > best_length:
+                    best_child, best_length = child, child_length
+            length[node_id] = best_length + 1
+            successor[node_id] = best_child
+
+        best_root, best_length = None, 0
+        for root in self.root_nodes:
+            if length.get(root, 0) > best_length:
+                best_root, best_length = root, length[root]
+
+        critical_path = []
+        node_id = best_root
+        while node_id is not None:
+            critical_path.append(node_id)
+            node_id = successor[node_id]
+        return critical_path
 
     def analyze_path(self) -> Dict[str, Any]:
         """Analyze the reasoning path for patterns and insights"""
-        if self.path_id in self.analysis_cache:
-            return self.analysis_cache[self.path_id]
+        if self._analysis is None:
+            self._analysis = self._build_analysis()
+        return self._analysis
 
-        analysis = {
+    def _build_analysis(self) -> Dict[str, Any]:
+        """Build the analysis returned by analyze_path()"""
+        return {
             "path_id": self.path_id,
             "total_nodes": len(self.nodes),
             "path_depth": self.get_path_depth(),
@@ -272,26 +375,20 @@ class ReasoningPath:
             "decision_quality": self._assess_decision_quality()
         }
 
-        self.analysis_cache[self.path_id] = analysis
-        return analysis
-
     def _analyze_step_distribution(self) -> Dict[str, int]:
         """Analyze distribution of reasoning steps"""
-        distribution = defaultdict(int)
-        for node in self.nodes.values():
-            distribution[node.step.value] += 1
-        return dict(distribution)
+        return dict(self._step_counts)
 
     def _analyze_confidence_progression(self) -> List[float]:
         """Analyze how confidence changes through the path"""
         # Sort nodes by timestamp
-        sorted_nodes = sorted(self.nodes.values(), key=lambda x: x.timestamp)
+        sorted_nodes = sorted(self.nodes.values(), key=lambda x: x.timestamp_ts)
         return [node.confidence_score for node in sorted_nodes]
 
     def _analyze_evidence_accumulation(self) -> List[float]:
         """Analyze how evidence strength accumulates"""
         # Sort nodes by timestamp
-        sorted_nodes = sorted(self.nodes.values(), key=lambda x: x.timestamp)
+        sorted_nodes = sorted(self.nodes.values(), key=lambda x: x.timestamp_ts)
         return [node.evidence_strength for node in sorted_nodes]
 
     def _identify_bottlenecks(self) -> List[Dict[str, Any]]:
@@ -302,7 +399,7 @@ class ReasoningPath:
             if node.processing_time > 1.0:  # More than 1 second
                 bottlenecks.append({
                     "node_id": node.node_id,
-                    "step": node.step.value,
+                    "step": node.step_value,
                     "processing_time": node.processing_time,
                     "confidence": node.confidence_score
                 })
@@ -345,14 +442,18 @@ class ReasoningPath:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert path to dictionary"""
+        return self._to_dict({node_id: node.to_dict() for node_id, node in self.nodes.items()})
+
+    def _to_dict(self, node_dicts: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert path to dictionary around already-serialized nodes"""
         return {
             "path_id": self.path_id,
             "initial_query": self.initial_query,
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "nodes": {node_id: node.to_dict() for node_id, node in self.nodes.items()},
-            "root_nodes": self.root_nodes,
-            "leaf_nodes": self.leaf_nodes,
+            "nodes": node_dicts,
+            "root_nodes": list(self.root_nodes),
+            "leaf_nodes": list(self.leaf_nodes),
             "total_processing_time": self.total_processing_time,
             "average_confidence": self.average_confidence,
             "evidence_strength": self.evidence_strength,
@@ -374,11 +475,10 @@ class ReasoningPath:
 
         # Reconstruct nodes
         for node_id, node_data in data.get("nodes", {}).items():
-            node = TraceNode.from_dict(node_data)
-            path.nodes[node_id] = node
+            path._track_node(TraceNode.from_dict(node_data))
 
-        path.root_nodes = data.get("root_nodes", [])
-        path.leaf_nodes = data.get("leaf_nodes", [])
+        path.root_nodes = dict.fromkeys(data.get("root_nodes", []))
+        path.leaf_nodes = dict.fromkeys(data.get("leaf_nodes", []))
         path.total_processing_time = data.get("total_processing_time", 0.0)
         path.average_confidence = data.get("average_confidence", 0.0)
         path.evidence_strength = data.get("evidence_strength", 0.0)
@@ -393,19 +493,40 @@ class ReasoningGlyphMapper:
     Maps reasoning processes to glyph traces for visualization and analysis.
     """
 
-    def __init__(self, glyph_generator: GlyphGenerator):
+    # Path ids, seeded like TraceNode ids
+    _path_counter = itertools.count(time.time_ns() // 1000)
+
+    def __init__(self, glyph_generator: GlyphGenerator, max_completed_paths: int = 1000,
+                 recycle_nodes: bool = False):
         """
         Initialize the reasoning glyph mapper.
 
         Args:
             glyph_generator: Glyph generator instance
+            max_completed_paths: Number of completed paths to keep
+            recycle_nodes: Return the nodes of evicted paths to the TraceNode pool;
+                only safe if callers do not hold on to paths after eviction
+
+        Raises:
+            ValueError: If max_completed_paths is less than 1
         """
+        if max_completed_paths < 1:
+            raise ValueError(f"max_completed_paths must be at least 1, got {max_completed_paths}")
+
         self.glyph_generator = glyph_generator
+        self.recycle_nodes = recycle_nodes
         self.active_paths: Dict[str, ReasoningPath] = {}
-        self.completed_paths: List[ReasoningPath] = []
 
         # Path storage
-        self.max_completed_paths = 1000  # Keep last 1000 completed paths
+        self.max_completed_paths = max_completed_paths
+        self.completed_paths: Deque[ReasoningPath] = deque(maxlen=self.max_completed_paths)
+        self._completed_by_id: Dict[str, ReasoningPath] = {}
+
+        # Per-path metrics for completed paths, in rings parallel to completed_paths
+        self._conf_arr = np.zeros(self.max_completed_paths)
+        self._time_arr = np.zeros(self.max_completed_paths)
+        self._depth_arr = np.zeros(self.max_completed_paths)
+        self._head = 0
 
         print("🧬 Reasoning Glyph Mapper initialized")
 
@@ -419,7 +540,7 @@ class ReasoningGlyphMapper:
         Returns:
             Path ID
         """
-        path_id = f"path_{int(time.time()*1000000)}"
+        path_id = f"path_{next(ReasoningGlyphMapper._path_counter)}"
         path = ReasoningPath(path_id, initial_query)
         self.active_paths[path_id] = path
 
@@ -431,7 +552,7 @@ class ReasoningGlyphMapper:
         )
 
         # Add initial node
-        initial_node = TraceNode(
+        initial_node = TraceNode.acquire(
             step=ReasoningStep.SEED_ACTIVATION,
             component="reasoning_mapper",
             data={"query": initial_query, "glyph_generated": True},
@@ -477,7 +598,7 @@ class ReasoningGlyphMapper:
         )
 
         # Create trace node
-        node = TraceNode(
+        node = TraceNode.acquire(
             step=step,
             component=component,
             data=data,
@@ -485,7 +606,7 @@ class ReasoningGlyphMapper:
         )
 
         # Add to path
-        path.add_node(node, parent_node_ids or path.leaf_nodes)
+        path.add_node(node, parent_node_ids or list(path.leaf_nodes))
 
         return node.node_id
 
@@ -514,13 +635,24 @@ class ReasoningGlyphMapper:
 
         path.complete_path(decision_outcome, verdict_confidence, processing_time)
 
-        # Move to completed paths
+        # Move to completed paths (deque evicts beyond max_completed_paths)
+        if len(self.completed_paths) == self.completed_paths.maxlen:
+            evicted = self.completed_paths[0]
+            if self._completed_by_id.get(evicted.path_id) is evicted:
+                del self._completed_by_id[evicted.path_id]
+            if self.recycle_nodes:
+                for node in evicted.nodes.values():
+                    node.release()
+                evicted.nodes.clear()
         self.completed_paths.append(path)
-        del self.active_paths[path_id]
+        self._completed_by_id[path_id] = path
 
-        # Maintain size limit
-        if len(self.completed_paths) > self.max_completed_paths:
-            self.completed_paths = self.completed_paths[-self.max_completed_paths:]
+        head = self._head
+        self._conf_arr[head] = path.verdict_confidence
+        self._time_arr[head] = path.total_processing_time
+        self._depth_arr[head] = path.get_path_depth()
+        self._head = (head + 1) % self.max_completed_paths
+        del self.active_paths[path_id]
 
         print(f"✅ Completed reasoning path {path_id} with verdict: {decision_outcome}")
         return True
@@ -531,18 +663,14 @@ class ReasoningGlyphMapper:
 
     def get_completed_paths(self, limit: int = 100) -> List[ReasoningPath]:
         """Get recently completed paths"""
-        return self.completed_paths[-limit:]
+        return list(itertools.islice(self.completed_paths, max(0, len(self.completed_paths) - limit), None))
 
     def get_path(self, path_id: str) -> Optional[ReasoningPath]:
         """Get a specific reasoning path"""
         if path_id in self.active_paths:
             return self.active_paths[path_id]
 
-        for path in self.completed_paths:
-            if path.path_id == path_id:
-                return path
-
-        return None
+        return self._completed_by_id.get(path_id)
 
     def get_total_paths(self) -> int:
         """Get total number of paths (active + completed)"""
@@ -558,11 +686,11 @@ class ReasoningGlyphMapper:
         if not self.completed_paths:
             return {"status": "no_completed_paths"}
 
-        # Aggregate analysis
+        # Aggregate analysis; the filled region of each ring is its first total_paths slots
         total_paths = len(self.completed_paths)
-        avg_confidence = sum(p.verdict_confidence for p in self.completed_paths) / total_paths
-        avg_processing_time = sum(p.total_processing_time for p in self.completed_paths) / total_paths
-        avg_path_depth = sum(p.get_path_depth() for p in self.completed_paths) / total_paths
+        avg_confidence = float(self._conf_arr[:total_paths].mean())
+        avg_processing_time = float(self._time_arr[:total_paths].mean())
+        avg_path_depth = float(self._depth_arr[:total_paths].mean())
 
         # Decision distribution
         decision_counts = defaultdict(int)
@@ -570,11 +698,10 @@ class ReasoningGlyphMapper:
             decision = str(path.decision_outcome)
             decision_counts[decision] += 1
 
-        # Step usage patterns
-        step_usage = defaultdict(int)
+        # Step usage patterns, merged from each path's running counts
+        step_usage: Counter = Counter()
         for path in self.completed_paths:
-            for node in path.nodes.values():
-                step_usage[node.step.value] += 1
+            step_usage.update(path._step_counts)
 
         # Quality assessment
         quality_distribution = defaultdict(int)
@@ -616,7 +743,7 @@ class ReasoningGlyphMapper:
                 if glyph:
                     glyphs.append({
                         "glyph": glyph,
-                        "step": node.step.value,
+                        "step": node.step_value,
                         "component": node.component,
                         "confidence": node.confidence_score
                     })
@@ -637,11 +764,26 @@ class ReasoningGlyphMapper:
         if not path:
             return None
 
-        analysis = path.analyze_path()
+        # Serialize nodes and collect their glyphs in a single pass;
+        # completed paths already carry their analysis
+        node_dicts = {}
+        glyphs = []
+        get_glyph_by_id = self.glyph_generator.get_glyph_by_id
+        for node_id, node in path.nodes.items():
+            node_dicts[node_id] = node.to_dict()
+            if node.glyph_id:
+                glyph = get_glyph_by_id(node.glyph_id)
+                if glyph:
+                    glyphs.append({
+                        "glyph": glyph,
+                        "step": node.step_value,
+                        "component": node.component,
+                        "confidence": node.confidence_score
+                    })
 
         return {
-            "path_info": path.to_dict(),
-            "analysis": analysis,
-            "glyphs": self.get_path_glyphs(path_id),
+            "path_info": path._to_dict(node_dicts),
+            "analysis": path.analyze_path(),
+            "glyphs": glyphs,
             "export_timestamp": datetime.now().isoformat()
         }
\ No newline at end of file
@@ -22,6 +22,7 @@ from lifecycle_control import LifecycleController, LifecycleState
 from glyph_trace_expansion import ReasoningGlyphMapper, ReasoningStep
 from self_repair import SelfRepairProtocols
 from dual_core_integration import DualCoreIntegration, SynchronizationMode
+from event_loop_policy import install_uvloop_policy
 from vault_core.telemetry_stream import TelemetryManager
 
 # Import existing vault system components
@@ -343,6 +344,9 @@ def main():
     print("🚀 Starting Caleon's Advanced Vault System Demo")
     print("=" * 60)
 
+    # Opt in to uvloop (if installed) before any event loop is created
+    install_uvloop_policy()
+
     # Initialize the advanced system
     vault_system = AdvancedVaultSystem("master_key_2024")
 
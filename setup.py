@@ -39,8 +39,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Software Development :: Libraries :: Python Modules",
@@ -48,7 +46,7 @@ setup(
         "Topic :: Database :: Database Engines/Servers",
         "Topic :: Internet :: WWW/HTTP :: HTTP Servers",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=read_requirements(),
     extras_require={
         "dev": [
@@ -66,6 +64,9 @@ setup(
             "sphinx-rtd-theme>=1.2.0",
             "myst-parser>=1.0.0",
         ],
+        "performance": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
         "analysis": [
             "visidata>=2.11",
             "pandas>=2.0.0",
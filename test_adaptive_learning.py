@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the Vault_System_1.0 adaptive learning experience buffer
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add vault to path
+vault_path = Path(__file__).parent / "Vault_System_1.0" / "vault_system"
+sys.path.insert(0, str(vault_path))
+
+from adaptive_learning import AdaptiveLearning
+
+ACTIONS = ["cache", "compress", "replicate", "evict", "noop"]
+STATE_KEYS = ["cpu", "memory", "disk", "network", "queue", "latency"]
+
+
+def _brute_force_aggregates(experiences):
+    reward_sum, count, success = {}, {}, {}
+    for experience in experiences:
+        action = experience.action
+        reward_sum[action] = reward_sum.get(action, 0.0) + experience.reward
+        count[action] = count.get(action, 0) + 1
+        if experience.reward > 0:
+            success[action] = success.get(action, 0) + 1
+    return reward_sum, count, success
+
+
+def _brute_force_best_action(experiences, state, available_actions, similarity_threshold=0.8):
+    query_keys = set(state)
+    totals = {}
+    for experience in experiences:
+        keys = set(experience.state)
+        similarity = len(keys & query_keys) / len(keys | query_keys)
+        if experience.action in available_actions and similarity >= similarity_threshold:
+            total, n = totals.get(experience.action, (0.0, 0))
+            totals[experience.action] = (total + experience.reward, n + 1)
+
+    action_values = {
+        action: totals[action][0] / totals[action][1] if action in totals else 0.0
+        for action in available_actions
+    }
+    return max(action_values, key=lambda k: action_values[k])
+
+
+def _nonzero(mapping):
+    return {key: value for key, value in mapping.items() if value}
+
+
+@pytest.fixture
+def learner():
+    learner = AdaptiveLearning(reflection_manager=None, predictive_engine=None)
+    learner.max_experiences = 64
+    learner._init_experience_buffer()
+    return learner
+
+
+def _fill(learner, n, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        keys = rng.choice(STATE_KEYS, size=rng.integers(1, len(STATE_KEYS) + 1), replace=False)
+        state = {str(key): float(rng.random()) for key in keys}
+        learner.add_experience(
+            state=state,
+            action=ACTIONS[rng.integers(len(ACTIONS))],
+            reward=float(rng.uniform(-1.0, 1.0)),
+            next_state=dict(state)
+        )
+
+
+@pytest.mark.parametrize("n", [10, 64, 65, 200, 1000])
+def test_ring_keeps_most_recent_experiences(learner, n):
+    _fill(learner, n)
+
+    experiences = learner.experiences
+    assert len(experiences) == min(n, learner.max_experiences)
+    assert learner.learning_metrics["total_experiences"] == n
+
+    # Replaying the same draws keeps only the last max_experiences of them
+    reference = AdaptiveLearning(reflection_manager=None, predictive_engine=None)
+    reference.max_experiences = n
+    reference._init_experience_buffer()
+    _fill(reference, n)
+    expected = reference.experiences[-learner.max_experiences:]
+    assert [(e.action, e.reward, e.state) for e in experiences] == \
+        [(e.action, e.reward, e.state) for e in expected]
+
+
+@pytest.mark.parametrize("n", [10, 64, 65, 200, 1000])
+def test_action_aggregates_match_brute_force(learner, n):
+    _fill(learner, n)
+
+    reward_sum, count, success = _brute_force_aggregates(learner.experiences)
+    assert _nonzero(learner._action_count) == count
+    assert _nonzero(learner._action_success) == success
+    assert learner._action_reward_sum.keys() >= reward_sum.keys()
+    for action, total in learner._action_reward_sum.items():
+        assert total == pytest.approx(reward_sum.get(action, 0.0), abs=1e-9)
+
+
+@pytest.mark.parametrize("n", [64, 65, 200, 1000])
+def test_best_action_matches_brute_force(learner, n):
+    _fill(learner, n, seed=n)
+    experiences = learner.experiences
+
+    rng = np.random.default_rng(n + 1)
+    for _ in range(50):
+        keys = rng.choice(STATE_KEYS, size=rng.integers(1, len(STATE_KEYS) + 1), replace=False)
+        state = {str(key): 0.0 for key in keys}
+        available = [str(a) for a in rng.choice(ACTIONS, size=rng.integers(1, len(ACTIONS) + 1), replace=False)]
+        assert learner._get_best_action(state, available) == \
+            _brute_force_best_action(experiences, state, available)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Tests for Vault_System_1.0 advanced security helpers
+"""
+
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+# Add vault to path
+vault_path = Path(__file__).parent / "Vault_System_1.0" / "vault_system"
+sys.path.insert(0, str(vault_path))
+
+import advanced_security
+from advanced_security import (
+    AdvancedSecurity,
+    IPBlocklist,
+    SecurityEvent,
+    SecurityIncident,
+    ThreatLevel,
+    SQL_INJECTION_SIGNATURES,
+    XSS_SIGNATURES,
+    SUSPICIOUS_KEYWORDS,
+    build_signature_scanner,
+    build_keyword_prefilter,
+)
+
+SIGNATURES = SQL_INJECTION_SIGNATURES + XSS_SIGNATURES
+
+REQUEST_BODIES = [
+    # SQL injection
+    "SELECT * FROM users",
+    "name=x' UNION ALL SELECT password",
+    "id=1 or 1=1",
+    "q=foo AND 2 = 2",
+    "DrOp TaBlE accounts",
+    "İNSERT INTO logs VALUES (1)",
+    "selıct name from users",
+    "ſelect * from users",
+    # XSS
+    "<script>alert(1)</script>",
+    "<ScRiPt src=x>steal()</sCrIpT>",
+    "href=JavaScript:alert(1)",
+    "<img src=x onerror = alert(1)>",
+    "<IFRAME src=evil></IFRAME>",
+    "<ıframe src=evil></İframe>",
+    "<ſcript>alert(1)</ſcript>",
+    "<iframe src=x></iframe>",
+    # Benign
+    "",
+    "hello world",
+    "order by price ascending",
+    "the selection was created later",
+    "İstanbul ısık",
+    "\u212aelvin ſign",
+    "café naïve résumé",
+    '{"key": "value", "n": 3}',
+]
+
+ENGINE_FLAGS = ["HYPERSCAN_AVAILABLE", "RE2_AVAILABLE"]
+
+
+@pytest.fixture
+def security():
+    return AdvancedSecurity(lifecycle_controller=None, telemetry_stream=None)
+
+
+def _reference(body):
+    return any(re.search(signature, body, re.I) for signature in SIGNATURES)
+
+
+def _engine_params():
+    params = []
+    for engine in ("hyperscan", "re2"):
+        available = getattr(advanced_security, f"{engine.upper()}_AVAILABLE")
+        params.append(pytest.param(engine, marks=pytest.mark.skipif(
+            not available, reason=f"{engine} not installed")))
+    params.append(pytest.param("re"))
+    return params
+
+
+def _force_engine(monkeypatch, engine):
+    for flag in ENGINE_FLAGS:
+        monkeypatch.setattr(advanced_security, flag, flag == f"{engine.upper()}_AVAILABLE")
+
+
+@pytest.mark.parametrize("engine", _engine_params())
+@pytest.mark.parametrize("body", REQUEST_BODIES)
+def test_signature_scanner_matches_reference(monkeypatch, engine, body):
+    _force_engine(monkeypatch, engine)
+    scan = build_signature_scanner(SIGNATURES)
+    assert scan(body) == _reference(body)
+
+
+@pytest.mark.parametrize("automaton", [
+    pytest.param(True, marks=pytest.mark.skipif(
+        not advanced_security.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")),
+    False,
+])
+@pytest.mark.parametrize("body", REQUEST_BODIES)
+def test_keyword_prefilter_never_drops_a_match(monkeypatch, automaton, body):
+    monkeypatch.setattr(advanced_security, "AHOCORASICK_AVAILABLE", automaton)
+    contains_keyword = build_keyword_prefilter(SUSPICIOUS_KEYWORDS)
+    if _reference(body):
+        assert contains_keyword(body)
+    scan = build_signature_scanner(SIGNATURES)
+    assert (contains_keyword(body) and scan(body)) == _reference(body)
+
+
+def test_blocklist_ipv4_containment():
+    blocklist = IPBlocklist()
+    blocklist.add("10.0.0.0/8")
+    blocklist.add("192.168.1.7")
+
+    assert "10.1.2.3" in blocklist
+    assert "10.255.255.255" in blocklist
+    assert "11.0.0.1" not in blocklist
+    assert "192.168.1.7" in blocklist
+    assert "192.168.1.8" not in blocklist
+    assert "10.0.0.0/8" in blocklist
+    assert "10.0.0.0/16" not in blocklist
+
+
+def test_blocklist_ipv6_containment():
+    blocklist = IPBlocklist()
+    blocklist.add("2001:db8::/32")
+    blocklist.add("fe80::1")
+
+    assert "2001:db8:abcd::1" in blocklist
+    assert "2001:db9::1" not in blocklist
+    assert "fe80::1" in blocklist
+    assert "fe80::2" not in blocklist
+    # An IPv4 address never matches an IPv6 range of the same integer value
+    assert "0.0.0.1" not in blocklist
+
+
+def test_blocklist_discard_range():
+    blocklist = IPBlocklist()
+    blocklist.add("10.0.0.0/8")
+    blocklist.add("10.1.0.0/16")
+
+    blocklist.discard("10.0.0.0/8")
+    assert "10.1.2.3" in blocklist
+    assert "10.2.0.1" not in blocklist
+
+    blocklist.discard("10.1.0.0/16")
+    assert "10.1.2.3" not in blocklist
+    assert len(blocklist) == 0
+
+    # Discarding something that is not blocked is a no-op
+    blocklist.discard("10.1.0.0/16")
+    blocklist.discard("172.16.0.0/12")
+    assert len(blocklist) == 0
+
+
+def test_blocklist_non_ip_values():
+    blocklist = IPBlocklist()
+    blocklist.add("unknown")
+
+    assert "unknown" in blocklist
+    assert "Unknown" not in blocklist
+    assert "127.0.0.1" not in blocklist
+
+    blocklist.discard("unknown")
+    assert "unknown" not in blocklist
+
+
+def test_blocklist_len_and_iteration():
+    blocklist = IPBlocklist()
+    entries = {"unknown", "10.0.0.0/8", "192.168.1.7", "2001:db8::/32", "fe80::1"}
+    for entry in entries:
+        blocklist.add(entry)
+    # Duplicates, including a non-canonical spelling of a range, are not recounted
+    blocklist.add("10.0.0.0/8")
+    blocklist.add("10.9.9.9/8")
+    blocklist.add("unknown")
+
+    assert len(blocklist) == len(entries)
+    assert set(blocklist) == entries
+
+
+def test_reblock_supersedes_earlier_expiry(monkeypatch, security):
+    now = [1000.0]
+    monkeypatch.setattr(advanced_security.time, "monotonic", lambda: now[0])
+
+    security.block_ip("203.0.113.5", duration=10)
+    security.block_ip("203.0.113.5", duration=100)
+    assert len(security._unblock_heap) == 2
+
+    # The first heap entry has expired but is superseded by the re-block
+    now[0] += 50
+    assert security.is_ip_blocked("203.0.113.5")
+    assert len(security._unblock_heap) == 1
+
+    now[0] += 51
+    assert not security.is_ip_blocked("203.0.113.5")
+    assert not security._unblock_heap
+    assert not security._block_expiry
+
+
+def test_block_expiry_covers_ranges(monkeypatch, security):
+    now = [1000.0]
+    monkeypatch.setattr(advanced_security.time, "monotonic", lambda: now[0])
+
+    security.block_ip("198.51.100.0/24", duration=30)
+    assert security.is_ip_blocked("198.51.100.77")
+
+    now[0] += 31
+    assert not security.is_ip_blocked("198.51.100.77")
+
+
+@pytest.mark.parametrize("key_size", [16, 24, 32])
+def test_encrypt_decrypt_round_trip(security, key_size):
+    security.generate_encryption_key("vault", key_size=key_size)
+    for plaintext in (b"", b"secret payload", bytes(range(256)) * 8):
+        encrypted = security.encrypt_data(plaintext, "vault")
+        assert len(encrypted) == 12 + len(plaintext) + 16
+        assert security.decrypt_data(encrypted, "vault") == plaintext
+
+
+def test_encrypt_uses_fresh_nonce(security):
+    security.generate_encryption_key("vault")
+    assert security.encrypt_data(b"same", "vault") != security.encrypt_data(b"same", "vault")
+
+
+@pytest.mark.parametrize("offset", [0, 12, -1])
+def test_tampered_ciphertext_raises_invalid_tag(security, offset):
+    security.generate_encryption_key("vault")
+    encrypted = bytearray(security.encrypt_data(b"secret payload", "vault"))
+    encrypted[offset] ^= 0x01
+    with pytest.raises(InvalidTag):
+        security.decrypt_data(bytes(encrypted), "vault")
+
+
+def test_decrypt_with_other_key_raises_invalid_tag(security):
+    security.generate_encryption_key("vault")
+    security.generate_encryption_key("other")
+    encrypted = security.encrypt_data(b"secret payload", "vault")
+    with pytest.raises(InvalidTag):
+        security.decrypt_data(encrypted, "other")
+
+
+def test_unknown_encryption_key_fails(security):
+    with pytest.raises(ValueError):
+        security.encrypt_data(b"data", "missing")
+    with pytest.raises(ValueError):
+        security.decrypt_data(b"\x00" * 28, "missing")
+
+
+@pytest.mark.parametrize("key_type, key_class", [
+    ("ed25519", ed25519.Ed25519PrivateKey),
+    ("rsa", rsa.RSAPrivateKey),
+])
+def test_sign_verify_round_trip(security, key_type, key_class):
+    private_key = security.generate_signing_keypair("signer", key_type=key_type)
+    assert isinstance(private_key, key_class)
+
+    signature = security.sign_data(b"manifest", "signer")
+    assert security.verify_signature(b"manifest", signature, "signer")
+    assert not security.verify_signature(b"manifest!", signature, "signer")
+
+    tampered = bytearray(signature)
+    tampered[0] ^= 0x01
+    assert not security.verify_signature(b"manifest", bytes(tampered), "signer")
+
+
+def test_signature_bound_to_keypair(security):
+    security.generate_signing_keypair("ed", key_type="ed25519")
+    security.generate_signing_keypair("other", key_type="ed25519")
+    security.generate_signing_keypair("rsa", key_type="rsa")
+
+    signature = security.sign_data(b"manifest", "ed")
+    assert not security.verify_signature(b"manifest", signature, "other")
+    assert not security.verify_signature(b"manifest", signature, "rsa")
+
+
+def test_unknown_signing_key_fails(security):
+    with pytest.raises(ValueError):
+        security.sign_data(b"data", "missing")
+    assert not security.verify_signature(b"data", b"\x00" * 64, "missing")
+
+
+def test_unsupported_signing_key_type(security):
+    with pytest.raises(ValueError):
+        security.generate_signing_keypair("signer", key_type="dsa")
+    assert "signer" not in security.signing_keys
+
+
+def _incident(n):
+    return SecurityIncident(
+        incident_id=f"inc_{n}",
+        event_type=SecurityEvent.SUSPICIOUS_ACTIVITY,
+        threat_level=ThreatLevel.MEDIUM,
+        description="test incident",
+        source_ip="203.0.113.5",
+        user_id=None,
+        timestamp_epoch=time.time(),
+        evidence={}
+    )
+
+
+def test_incidents_counted_when_queued(security):
+    async def scenario():
+        security._incident_flusher = asyncio.get_running_loop().create_future()
+        for n in range(3):
+            await security._record_security_incident(_incident(n))
+        # Queued but not yet flushed: already counted, not yet stored
+        assert security.get_security_metrics()["incidents_detected"] == 3
+        assert not security.incidents
+
+        batch = [security._incident_queue.get_nowait() for _ in range(3)]
+        security._store_incidents(batch)
+        assert security.get_security_metrics()["incidents_detected"] == 3
+        assert len(security.incidents) == 3
+
+    asyncio.run(scenario())
+
+
+def test_incidents_counted_when_stored_directly(security):
+    asyncio.run(security._record_security_incident(_incident(0)))
+    assert security.get_security_metrics()["incidents_detected"] == 1
+    assert len(security.incidents) == 1
+
+
+def test_recent_incidents_are_independent_copies(security):
+    asyncio.run(security._record_security_incident(_incident(0)))
+
+    first = security.get_recent_incidents()[0]
+    first["annotated"] = True
+    first.pop("description")
+
+    second = security.get_recent_incidents()[0]
+    assert "annotated" not in second
+    assert second["description"] == "test incident"